@@ -0,0 +1,33 @@
+"""query log text hash
+
+Revision ID: a6e3c8f04b19
+Revises: f29c6d1e8a47
+Create Date: 2026-10-15 14:58:22.106731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e3c8f04b19'
+down_revision: Union[str, Sequence[str], None] = 'f29c6d1e8a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('query_logs', sa.Column(
+        'query_text_hash', sa.BigInteger(),
+        sa.Computed('hashtextextended(query_text, 0)', persisted=True), nullable=False,
+    ))
+    op.create_index(op.f('ix_query_logs_query_text_hash'), 'query_logs', ['query_text_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_query_logs_query_text_hash'), table_name='query_logs')
+    op.drop_column('query_logs', 'query_text_hash')
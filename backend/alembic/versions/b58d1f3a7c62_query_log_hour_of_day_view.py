@@ -0,0 +1,38 @@
+"""query log hour of day view
+
+Revision ID: b58d1f3a7c62
+Revises: a6e3c8f04b19
+Create Date: 2026-10-15 15:20:48.391055
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58d1f3a7c62'
+down_revision: Union[str, Sequence[str], None] = 'a6e3c8f04b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_query_log_hourly AS
+        SELECT
+            EXTRACT(HOUR FROM created_at)::smallint AS hour_of_day,
+            COUNT(*) AS n
+        FROM query_logs
+        GROUP BY 1
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_query_log_hourly_hour_of_day "
+        "ON mv_query_log_hourly (hour_of_day)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_query_log_hourly")
@@ -0,0 +1,29 @@
+"""ticket list indexes
+
+Revision ID: b7d2e4f1c9a3
+Revises: a413c6e60e09
+Create Date: 2026-10-15 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f1c9a3'
+down_revision: Union[str, Sequence[str], None] = 'a413c6e60e09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tickets_agent_status_created', 'tickets', ['assigned_agent_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_tickets_status_created', 'tickets', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_status_created', table_name='tickets')
+    op.drop_index('ix_tickets_agent_status_created', table_name='tickets')
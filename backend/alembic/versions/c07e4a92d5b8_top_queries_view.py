@@ -0,0 +1,42 @@
+"""top queries view
+
+Revision ID: c07e4a92d5b8
+Revises: b58d1f3a7c62
+Create Date: 2026-10-15 15:47:13.664820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c07e4a92d5b8'
+down_revision: Union[str, Sequence[str], None] = 'b58d1f3a7c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_top_queries AS
+        SELECT
+            query_text_hash,
+            MIN(query_text) AS query_text,
+            COUNT(*) AS cnt,
+            AVG(confidence_score) AS avg_conf
+        FROM query_logs
+        GROUP BY query_text_hash
+        ORDER BY cnt DESC
+        LIMIT 1000
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_top_queries_query_text_hash "
+        "ON mv_top_queries (query_text_hash)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_top_queries")
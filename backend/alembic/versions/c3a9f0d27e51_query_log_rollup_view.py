@@ -0,0 +1,49 @@
+"""query log rollup view
+
+Revision ID: c3a9f0d27e51
+Revises: b7d2e4f1c9a3
+Create Date: 2026-10-15 11:04:27.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9f0d27e51'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e4f1c9a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_query_log_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            date_trunc('hour', created_at) AS hour,
+            COUNT(*) AS n,
+            COUNT(*) FILTER (WHERE escalated) AS esc,
+            COUNT(confidence_score) AS conf_n,
+            SUM(confidence_score) AS conf_sum,
+            COUNT(response_time_ms) AS rt_n,
+            SUM(response_time_ms) AS rt_sum,
+            COUNT(*) FILTER (WHERE confidence_score >= 0.7) AS hi,
+            COUNT(*) FILTER (WHERE confidence_score >= 0.4 AND confidence_score < 0.7) AS med,
+            COUNT(*) FILTER (WHERE confidence_score < 0.4) AS lo,
+            COUNT(*) FILTER (WHERE has_sufficient_evidence) AS ev,
+            SUM(sources_count) AS src_sum
+        FROM query_logs
+        GROUP BY 1, 2
+    """)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_query_log_daily_day_hour "
+        "ON mv_query_log_daily (day, hour)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_query_log_daily")
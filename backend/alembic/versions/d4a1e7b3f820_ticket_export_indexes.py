@@ -0,0 +1,32 @@
+"""ticket export indexes
+
+Revision ID: d4a1e7b3f820
+Revises: c07e4a92d5b8
+Create Date: 2026-10-15 17:12:36.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a1e7b3f820'
+down_revision: Union[str, Sequence[str], None] = 'c07e4a92d5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tickets_created_at', 'tickets', ['created_at'], unique=False)
+    op.create_index('ix_tickets_conversation_status', 'tickets', ['conversation_id', 'status'], unique=False)
+    # Superseded by ix_tickets_conversation_status (same leading column)
+    op.drop_index(op.f('ix_tickets_conversation_id'), table_name='tickets')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_tickets_conversation_id'), 'tickets', ['conversation_id'], unique=False)
+    op.drop_index('ix_tickets_conversation_status', table_name='tickets')
+    op.drop_index('ix_tickets_created_at', table_name='tickets')
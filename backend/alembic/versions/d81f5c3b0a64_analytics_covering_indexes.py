@@ -0,0 +1,39 @@
+"""analytics covering indexes
+
+Revision ID: d81f5c3b0a64
+Revises: c3a9f0d27e51
+Create Date: 2026-10-15 12:37:09.104553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f5c3b0a64'
+down_revision: Union[str, Sequence[str], None] = 'c3a9f0d27e51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_query_logs_created_covering', 'query_logs', ['created_at'], unique=False,
+        postgresql_include=['escalated', 'confidence_score', 'response_time_ms', 'has_sufficient_evidence', 'sources_count'],
+    )
+    op.drop_index(op.f('ix_query_logs_created_at'), table_name='query_logs')
+    op.drop_index('ix_tickets_status_created', table_name='tickets')
+    op.create_index(
+        'ix_tickets_status_created', 'tickets', ['status', 'created_at'], unique=False,
+        postgresql_include=['resolved_at', 'assigned_agent_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_status_created', table_name='tickets')
+    op.create_index('ix_tickets_status_created', 'tickets', ['status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_query_logs_created_at'), 'query_logs', ['created_at'], unique=False)
+    op.drop_index('ix_query_logs_created_covering', table_name='query_logs')
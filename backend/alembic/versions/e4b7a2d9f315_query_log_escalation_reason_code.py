@@ -0,0 +1,43 @@
+"""query log escalation reason code
+
+Revision ID: e4b7a2d9f315
+Revises: d81f5c3b0a64
+Create Date: 2026-10-15 13:52:44.870213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7a2d9f315'
+down_revision: Union[str, Sequence[str], None] = 'd81f5c3b0a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('query_logs', sa.Column('escalation_reason_code', sa.SmallInteger(), server_default='0', nullable=False))
+    # Backfill: 1 = low confidence, 2 = customer requested, 0 = other
+    op.execute("""
+        UPDATE query_logs
+        SET escalation_reason_code = CASE
+            WHEN escalation_reason ILIKE '%confidence%' THEN 1
+            WHEN escalation_reason ILIKE '%customer%' THEN 2
+            ELSE 0
+        END
+        WHERE escalated
+    """)
+    op.create_index(
+        'ix_query_logs_escalation_reason_code', 'query_logs', ['escalation_reason_code'], unique=False,
+        postgresql_where=sa.text('escalated'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_query_logs_escalation_reason_code', table_name='query_logs', postgresql_where=sa.text('escalated'))
+    op.drop_column('query_logs', 'escalation_reason_code')
@@ -0,0 +1,30 @@
+"""document content sha256
+
+Revision ID: f29c6d1e8a47
+Revises: e4b7a2d9f315
+Create Date: 2026-10-15 14:31:07.512384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f29c6d1e8a47'
+down_revision: Union[str, Sequence[str], None] = 'e4b7a2d9f315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('documents', sa.Column('content_sha256', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('documents_content_sha256_key', 'documents', ['content_sha256'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('documents_content_sha256_key', 'documents', type_='unique')
+    op.drop_column('documents', 'content_sha256')
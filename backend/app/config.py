@@ -32,17 +32,35 @@ class Settings(BaseSettings):
 
     # ── Embeddings ────────────────────────────────────────────
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    EMBEDDING_DEVICE: str = ""  # "cuda", "cpu", ... — empty lets sentence-transformers pick
+    EMBEDDING_BATCH_SIZE: int = 64  # Chunks per encode() call during ingestion
+    EMBEDDING_HALF_PRECISION: bool = False  # FP16 weights when the model runs on a CUDA device
 
     # ── Auth / JWT ────────────────────────────────────────────
     JWT_SECRET_KEY: str = "change-this-to-a-random-secret-key-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRY_HOURS: int = 24
+    USER_CACHE_TTL_SECONDS: int = 30  # Login email → user lookup cache (0 = no caching)
+    TOKEN_CACHE_SECONDS: int = 0  # Reuse a verified JWT payload for this long (0 = verify every request; the test suite uses 30)
+    BCRYPT_ROUNDS: int = 12  # Password hash cost; the test suite lowers it to 4 — keep 12+ in production
 
     # ── File Upload ───────────────────────────────────────────
     UPLOAD_DIR: str = "./uploads"
 
     # ── Ingestion ─────────────────────────────────────────────
     SKIP_INGESTION: bool = False  # Set True on Render free tier (not enough RAM)
+    INGESTION_WORKERS: int = 1  # Dedicated ingestion threads (parse + embed), separate from request handling
+
+    # ── Analytics ─────────────────────────────────────────────
+    ANALYTICS_ROLLUP_REFRESH_SECONDS: int = 300  # mv_query_log_daily refresh period (0 = never)
+    ANALYTICS_CACHE_TTL_SECONDS: int = 120  # Dashboard result cache lifetime (0 = no caching)
+
+    # ── Reports ───────────────────────────────────────────────
+    PDF_MAX_TICKET_ROWS: int = 5000  # Escalation PDF ticket table cap (full list is in the CSV export)
+    REPORT_DIR: str = "./reports"  # Finished background report jobs (shared by all workers)
+    REPORT_WORKERS: int = 2  # Threads building background PDF reports
+    REPORT_RETENTION_HOURS: int = 24  # Finished job files older than this are pruned
+    REPORT_BUILD_TIMEOUT_SECONDS: int = 600  # A job still pending after this is reported failed (worker died)
 
     # ── CORS ──────────────────────────────────────────────────
     CORS_ORIGINS: str = ""  # Comma-separated extra origins (e.g. Vercel URL)
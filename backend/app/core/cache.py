@@ -0,0 +1,90 @@
+"""In-process TTL cache for slowly changing, read-heavy results."""
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable
+
+
+class TTLCache:
+    """Thread-safe dict of ``key -> (expires_at, value)`` entries."""
+
+    def __init__(self) -> None:
+        self._data: dict[tuple, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """Return ``(hit, value)``; expired entries count as misses."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return False, None
+            return True, value
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Session.info key holding per-session memoized results
+SESSION_MEMO_KEY = "cached_results"
+
+
+def clear_session_memo(session) -> None:
+    """Forget results memoized on *session* (e.g. after it wrote new data)."""
+    session.info.pop(SESSION_MEMO_KEY, None)
+
+
+def cached(cache: TTLCache, ttl: Callable[[], float]):
+    """Cache a ``fn(db, *args, **kwargs)`` result, keyed on everything but ``db``.
+
+    Arguments are bound to *fn*'s signature (defaults applied) before keying,
+    so ``f(db, s, e, "day")``, ``f(db, s, e, interval="day")`` and ``f(db)``
+    with matching defaults all share one entry — dashboard endpoints and
+    report exports hit the same cached results.
+
+    Results are also memoized on the session (``db.info``), so one request
+    that builds several reports computes each aggregate once even when the
+    shared cache is disabled or has just expired.
+
+    *ttl* is read on every call so settings can be changed at runtime;
+    a TTL of 0 disables the shared cache. Cached values are shared between
+    callers and must be treated as read-only.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(db, *args, **kwargs):
+            bound = signature.bind(db, *args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__qualname__, *list(bound.arguments.values())[1:])
+            memo = db.info.setdefault(SESSION_MEMO_KEY, {})
+            if key in memo:
+                return memo[key]
+
+            seconds = ttl()
+            if seconds > 0:
+                hit, value = cache.get(key)
+                if hit:
+                    memo[key] = value
+                    return value
+            value = fn(db, *args, **kwargs)
+            if seconds > 0:
+                cache.set(key, value, seconds)
+            memo[key] = value
+            return value
+
+        return wrapper
+
+    return decorator
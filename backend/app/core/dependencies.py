@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.core.security import decode_access_token
 from app.database import get_db
 from app.models.user import User
+from app.services import user_service
 
 bearer_scheme = HTTPBearer()
 
@@ -28,7 +29,7 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token missing user identifier",
         )
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = user_service.get_user_by_id(db, int(user_id))
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
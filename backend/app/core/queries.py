@@ -0,0 +1,13 @@
+"""Small query helpers shared by routers and services."""
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+
+def fast_count(query: Query, column) -> int:
+    """Count rows matched by *query* without the ``SELECT count(*) FROM (...)`` wrapper.
+
+    Counting *column* (the primary key) keeps the FROM clause intact even
+    when the query carries no filters. Only valid without GROUP BY/HAVING.
+    """
+    return query.order_by(None).with_entities(func.count(column)).scalar() or 0
@@ -1,5 +1,7 @@
 """JWT token creation / verification and password hashing utilities."""
 
+import functools
+import time
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
@@ -7,7 +9,7 @@ from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 
 # ── Password hashing ─────────────────────────────────────────
@@ -32,9 +34,30 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
-def decode_access_token(token: str) -> dict | None:
-    """Decode and validate a JWT token. Returns payload or None."""
+def _decode(token: str) -> dict | None:
     try:
         return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
     except JWTError:
         return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_cached(token: str, _window: int) -> dict | None:
+    # _window only makes entries expire: it changes every TOKEN_CACHE_SECONDS
+    return _decode(token)
+
+
+def decode_access_token(token: str) -> dict | None:
+    """Decode and validate a JWT token. Returns payload or None.
+
+    A client sends the same token on every request, so the verified payload
+    is reused for up to TOKEN_CACHE_SECONDS — never past the token's own
+    expiry. The payload is shared and must be treated as read-only.
+    """
+    window = settings.TOKEN_CACHE_SECONDS
+    if window <= 0:
+        return _decode(token)
+    payload = _decode_cached(token, int(time.monotonic() // window))
+    if payload is not None and payload.get("exp", 0) <= time.time():
+        return None
+    return payload
@@ -1,10 +1,13 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings  # noqa: F401
 from app.routers import auth as auth_router
@@ -14,6 +17,7 @@ from app.routers import tickets as tickets_router
 from app.routers import analytics as analytics_router
 from app.routers import reports as reports_router
 from app.routers import ai_config as ai_config_router
+from app.services import report_service, rollup_service
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +42,33 @@ async def lifespan(app: FastAPI):
         except Exception as seed_err:
             logger.warning(f"Seed skipped: {seed_err}")
 
+        # Pre-aggregated query_logs buckets for the dashboard charts (created by Alembic;
+        # analytics scans query_logs directly while they are missing)
+        try:
+            with engine.connect() as conn:
+                missing = rollup_service.missing_rollups(conn)
+            if missing:
+                logger.warning(
+                    f"Analytics rollups missing ({', '.join(missing)}) — run `alembic upgrade head` "
+                    "(first `alembic stamp a413c6e60e09` if the tables were made by create_all)"
+                )
+        except Exception as rollup_err:
+            logger.warning(f"Analytics rollups unavailable: {rollup_err}")
+
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
 
+    # Load ReportLab fonts/metrics now rather than on the first export
+    report_service.warm_up()
+
+    refresh_task = None
+    if settings.ANALYTICS_ROLLUP_REFRESH_SECONDS > 0:
+        refresh_task = asyncio.create_task(rollup_service.refresh_loop(engine))
+
     yield
+
+    if refresh_task:
+        refresh_task.cancel()
     logger.info("Shutting down RAG Customer Support API")
 
 
@@ -50,6 +77,7 @@ app = FastAPI(
     description="Retrieval-Augmented Generation based customer support system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson: faster encoding of large list payloads
 )
 
 # ── CORS — allow React frontend ──────────────────────────────
@@ -75,6 +103,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Gzip — CSV exports and large JSON lists ───────────────
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ── Routers ───────────────────────────────────────────────────
 # Debug endpoint for CORS troubleshooting
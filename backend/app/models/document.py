@@ -3,8 +3,8 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Enum, ForeignKey, Integer, String, Text, func, select
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from app.database import Base
 
@@ -25,6 +25,7 @@ class Document(Base):
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
     page_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True)
     status: Mapped[DocumentStatus] = mapped_column(
         Enum(DocumentStatus, name="document_status", create_constraint=True),
         nullable=False,
@@ -42,6 +43,7 @@ class Document(Base):
     chunks: Mapped[list["DocumentChunk"]] = relationship(
         back_populates="document",
         cascade="all, delete-orphan",
+        passive_deletes=True,  # rows go via ON DELETE CASCADE / bulk delete, not one by one
     )
 
     def __repr__(self) -> str:
@@ -64,3 +66,14 @@ class DocumentChunk(Base):
 
     def __repr__(self) -> str:
         return f"<DocumentChunk id={self.id} doc={self.document_id} idx={self.chunk_index}>"
+
+
+# Chunk count as a correlated subquery. Deferred: loads on first access, or
+# for a whole page in one statement via .options(undefer(Document.chunk_count)).
+Document.chunk_count = column_property(
+    select(func.count(DocumentChunk.id))
+    .where(DocumentChunk.document_id == Document.id)
+    .correlate_except(DocumentChunk)
+    .scalar_subquery(),
+    deferred=True,
+)
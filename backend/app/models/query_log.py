@@ -1,15 +1,53 @@
 """QueryLog model — logs every RAG query for analytics."""
 
+import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, Computed, Float, ForeignKey, Index, Integer, SmallInteger, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
 
 
+class EscalationReasonCode(enum.IntEnum):
+    """Normalized escalation reason, stored alongside the free-text reason."""
+
+    other = 0
+    low_confidence = 1
+    customer_requested = 2
+
+    @classmethod
+    def from_reason(cls, reason: str | None) -> "EscalationReasonCode":
+        """Classify a free-text reason (same rules as the backfill migration)."""
+        lowered = (reason or "").lower()
+        if "confidence" in lowered:
+            return cls.low_confidence
+        if "customer" in lowered:
+            return cls.customer_requested
+        return cls.other
+
+
 class QueryLog(Base):
     __tablename__ = "query_logs"
+    __table_args__ = (
+        # Covering index: date-ranged analytics aggregates become index-only scans
+        Index(
+            "ix_query_logs_created_covering",
+            "created_at",
+            postgresql_include=[
+                "escalated",
+                "confidence_score",
+                "response_time_ms",
+                "has_sufficient_evidence",
+                "sources_count",
+            ],
+        ),
+        Index(
+            "ix_query_logs_escalation_reason_code",
+            "escalation_reason_code",
+            postgresql_where=text("escalated"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     conversation_id: Mapped[int | None] = mapped_column(
@@ -19,6 +57,12 @@ class QueryLog(Base):
     )
     customer_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True, index=True)
     query_text: Mapped[str] = mapped_column(Text, nullable=False)
+    # 8-byte key for grouping identical questions without hashing the full text
+    query_text_hash: Mapped[int] = mapped_column(
+        BigInteger,
+        Computed("hashtextextended(query_text, 0)", persisted=True),
+        index=True,
+    )
     response_text: Mapped[str] = mapped_column(Text, nullable=False)
     confidence_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     has_sufficient_evidence: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -26,8 +70,14 @@ class QueryLog(Base):
     primary_source_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     escalated: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
     escalation_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    escalation_reason_code: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=EscalationReasonCode.other,
+        server_default="0",
+    )
     response_time_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
     def __repr__(self) -> str:
         return f"<QueryLog id={self.id} confidence={self.confidence_score} escalated={self.escalated}>"
@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -28,13 +28,23 @@ class TicketPriority(str, enum.Enum):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Serve list_tickets filters + ORDER BY created_at DESC (scanned backwards)
+        Index("ix_tickets_agent_status_created", "assigned_agent_id", "status", "created_at"),
+        Index(
+            "ix_tickets_status_created",
+            "status",
+            "created_at",
+            postgresql_include=["resolved_at", "assigned_agent_id"],
+        ),
+        # Date-ranged exports ordered by created_at DESC
+        Index("ix_tickets_created_at", "created_at"),
+        # create_ticket's open-ticket-per-conversation check (also serves FK lookups)
+        Index("ix_tickets_conversation_status", "conversation_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    conversation_id: Mapped[int] = mapped_column(
-        ForeignKey("conversations.id"),
-        nullable=False,
-        index=True,
-    )
+    conversation_id: Mapped[int] = mapped_column(ForeignKey("conversations.id"), nullable=False)
     customer_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     assigned_agent_id: Mapped[int | None] = mapped_column(
         ForeignKey("users.id"),
@@ -60,6 +70,9 @@ class Ticket(Base):
     conversation: Mapped["Conversation"] = relationship(  # type: ignore[name-defined]
         back_populates="tickets",
     )
+    customer: Mapped["User"] = relationship(  # type: ignore[name-defined]
+        foreign_keys=[customer_id],
+    )
     assigned_agent: Mapped["User | None"] = relationship(  # type: ignore[name-defined]
         back_populates="assigned_tickets",
         foreign_keys=[assigned_agent_id],
@@ -17,18 +17,31 @@ def get_model() -> SentenceTransformer:
     global _model
     if _model is None:
         logger.info("Loading embedding model: %s", settings.EMBEDDING_MODEL)
-        _model = SentenceTransformer(settings.EMBEDDING_MODEL)
-        logger.info("Embedding model loaded (dim=%d)", _model.get_sentence_embedding_dimension())
+        _model = SentenceTransformer(settings.EMBEDDING_MODEL, device=settings.EMBEDDING_DEVICE or None)
+        if settings.EMBEDDING_HALF_PRECISION and _model.device.type == "cuda":
+            _model.half()
+        logger.info(
+            "Embedding model loaded (dim=%d, device=%s)",
+            _model.get_sentence_embedding_dimension(),
+            _model.device,
+        )
     return _model
 
 
 def embed_texts(texts: list[str]) -> list[list[float]]:
     """Encode a batch of texts into embedding vectors.
 
+    Texts are fed to the model EMBEDDING_BATCH_SIZE at a time so a whole
+    document is embedded in a few large calls (amortises GPU launch cost).
     Returns a list of float vectors (one per input text).
     """
     model = get_model()
-    embeddings = model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
+    embeddings = model.encode(
+        texts,
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+    )
     return embeddings.tolist()
 
 
@@ -11,7 +11,7 @@ from sqlalchemy.orm import Session
 from app.core.dependencies import get_current_user
 from app.database import get_db
 from app.models.conversation import Conversation, ConversationStatus, Message, SenderRole
-from app.models.query_log import QueryLog
+from app.models.query_log import EscalationReasonCode, QueryLog
 from app.models.ticket import Ticket, TicketStatus
 from app.models.user import User
 from app.rag.pipeline import process_query
@@ -463,6 +463,11 @@ async def send_message(
     db.add(ai_msg)
 
     # Log to QueryLog for analytics
+    escalation_reason = (
+        "Low confidence (auto-escalate)"
+        if result["confidence"]["escalation_action"] == "auto"
+        else None
+    )
     query_log = QueryLog(
         conversation_id=conversation_id,
         customer_id=current_user.id,
@@ -473,11 +478,8 @@ async def send_message(
         sources_count=len(result["sources"]),
         primary_source_score=result["sources"][0]["score"] if result["sources"] else None,
         escalated=result["confidence"]["escalation_action"] == "auto",
-        escalation_reason=(
-            "Low confidence (auto-escalate)"
-            if result["confidence"]["escalation_action"] == "auto"
-            else None
-        ),
+        escalation_reason=escalation_reason,
+        escalation_reason_code=EscalationReasonCode.from_reason(escalation_reason),
         response_time_ms=result["response_time_ms"],
     )
     db.add(query_log)
@@ -2,7 +2,7 @@
 
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -28,13 +28,12 @@ router = APIRouter(prefix="/api/documents", tags=["Documents"])
 @router.post("/", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def upload_document(
     file: UploadFile,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ):
     """Upload a PDF document. Ingestion runs in the background."""
     try:
-        doc = await document_service.upload_document(db, file, current_user.id)
+        doc, created = await document_service.upload_document(db, file, current_user.id)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     except Exception as exc:
@@ -44,13 +43,10 @@ async def upload_document(
             detail="Document upload failed. Check logs for details.",
         )
 
-    # Schedule ingestion as a background task (won't block the response)
-    if not settings.SKIP_INGESTION:
-        background_tasks.add_task(
-            document_service.run_ingestion,
-            doc.id,
-            doc.file_path,
-        )
+    # Queue ingestion on the ingestion pool (won't block the response);
+    # re-uploads of an already stored file reuse its chunks instead
+    if created and not settings.SKIP_INGESTION:
+        document_service.submit_ingestion(doc.id, doc.file_path)
 
     return _doc_to_response(doc, db)
 
@@ -93,7 +89,7 @@ async def delete_document(
 ):
     """Delete a document (DB + Qdrant + file)."""
     try:
-        document_service.delete_document(db, document_id)
+        await document_service.delete_document(db, document_id)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
     return DocumentDeleteResponse(detail="Document deleted", document_id=document_id)
@@ -103,21 +99,7 @@ async def delete_document(
 
 def _doc_to_response(doc, db) -> DocumentResponse:
     """Convert a Document ORM object to a response schema with chunk_count."""
-    from app.models.document import DocumentChunk
-
-    chunk_count = db.query(DocumentChunk).filter(DocumentChunk.document_id == doc.id).count()
-    return DocumentResponse(
-        id=doc.id,
-        title=doc.title,
-        file_path=doc.file_path,
-        file_size=doc.file_size,
-        page_count=doc.page_count,
-        status=doc.status.value,
-        uploaded_by=doc.uploaded_by,
-        created_at=doc.created_at,
-        updated_at=doc.updated_at,
-        chunk_count=chunk_count,
-    )
+    return DocumentResponse.model_validate(doc).model_copy(update={"status": doc.status.value})
 
 
 # ── Source verification endpoints (Week 5 — Explainability) ──
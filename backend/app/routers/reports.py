@@ -1,15 +1,18 @@
 """Reports router — Admin-only CSV and PDF export endpoints."""
 
+import asyncio
 import logging
+import re
+from collections.abc import Callable, Iterator
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from app.core.dependencies import require_role
-from app.database import get_db
+from app.database import SessionLocal
 from app.models.user import User
+from app.schemas.report import ReportJobResponse
 from app.services import report_service
 
 logger = logging.getLogger(__name__)
@@ -17,9 +20,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/reports", tags=["Reports"])
 
 
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_NODASH = str.maketrans("", "", "-")
+
+
 # ── Helper: parse optional date strings ──────────────────────
 def _parse_date(value: str | None) -> datetime | None:
-    if not value:
+    # Cheap shape check first so obviously bad input skips the exception path
+    if not value or not _ISO_DATE.match(value):
         return None
     try:
         return datetime.fromisoformat(value)
@@ -27,10 +35,36 @@ def _parse_date(value: str | None) -> datetime | None:
         return None
 
 
-def _csv_response(content: str, filename: str) -> Response:
-    """Create a CSV download response."""
-    return Response(
-        content=content,
+def _stream_csv(generate: Callable[..., Iterator[str]], *args) -> Iterator[str]:
+    """Run a CSV generator on its own session.
+
+    The body is streamed after the request's ``get_db`` session has been
+    closed, so the export opens (and closes) a session of its own.
+    """
+    db = SessionLocal()
+    try:
+        yield from generate(db, *args)
+    finally:
+        db.close()
+
+
+def _build_pdf(generate: Callable[..., bytes], *args) -> bytes:
+    """Build a PDF on its own session (called in a worker thread).
+
+    Sessions aren't thread-safe, so the request's ``get_db`` session is
+    never handed to the thread doing the layout.
+    """
+    db = SessionLocal()
+    try:
+        return generate(db, *args)
+    finally:
+        db.close()
+
+
+def _csv_response(content: Iterator[str], filename: str) -> StreamingResponse:
+    """Create a streaming CSV download response."""
+    return StreamingResponse(
+        content,
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -49,9 +83,9 @@ def _build_filename(prefix: str, ext: str, start: str | None, end: str | None) -
     """Build a descriptive filename with optional date range."""
     parts = [prefix]
     if start:
-        parts.append(start.replace("-", ""))
+        parts.append(start.translate(_NODASH))
     if end:
-        parts.append(end.replace("-", ""))
+        parts.append(end.translate(_NODASH))
     return "_".join(parts) + f".{ext}"
 
 
@@ -60,13 +94,12 @@ def _build_filename(prefix: str, ext: str, start: str | None, end: str | None) -
 async def download_query_logs(
     start_date: str | None = Query(None, description="ISO 8601 start date"),
     end_date: str | None = Query(None, description="ISO 8601 end date"),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ) -> Response:
     """Download query logs as CSV."""
     logger.info("Admin %s exporting query logs CSV", current_user.id)
-    csv_data = report_service.generate_query_log_csv(
-        db, _parse_date(start_date), _parse_date(end_date),
+    csv_data = _stream_csv(
+        report_service.generate_query_log_csv, _parse_date(start_date), _parse_date(end_date),
     )
     filename = _build_filename("query_logs", "csv", start_date, end_date)
     return _csv_response(csv_data, filename)
@@ -78,21 +111,21 @@ async def download_escalations(
     format: str = Query("csv", description="csv or pdf"),
     start_date: str | None = Query(None, description="ISO 8601 start date"),
     end_date: str | None = Query(None, description="ISO 8601 end date"),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ) -> Response:
     """Download escalation report as CSV or PDF."""
     logger.info("Admin %s exporting escalations (%s)", current_user.id, format)
 
     if format.lower() == "pdf":
-        pdf_data = report_service.generate_escalation_pdf(
-            db, _parse_date(start_date), _parse_date(end_date),
+        # ReportLab layout is CPU-bound — build off the event loop
+        pdf_data = await asyncio.to_thread(
+            _build_pdf, report_service.generate_escalation_pdf, _parse_date(start_date), _parse_date(end_date),
         )
         filename = _build_filename("escalation_report", "pdf", start_date, end_date)
         return _pdf_response(pdf_data, filename)
 
-    csv_data = report_service.generate_escalation_csv(
-        db, _parse_date(start_date), _parse_date(end_date),
+    csv_data = _stream_csv(
+        report_service.generate_escalation_csv, _parse_date(start_date), _parse_date(end_date),
     )
     filename = _build_filename("escalations", "csv", start_date, end_date)
     return _csv_response(csv_data, filename)
@@ -103,13 +136,13 @@ async def download_escalations(
 async def download_analytics(
     start_date: str | None = Query(None, description="ISO 8601 start date"),
     end_date: str | None = Query(None, description="ISO 8601 end date"),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ) -> Response:
     """Download a comprehensive analytics PDF report."""
     logger.info("Admin %s exporting analytics PDF", current_user.id)
-    pdf_data = report_service.generate_analytics_pdf(
-        db, _parse_date(start_date), _parse_date(end_date),
+    # ReportLab layout is CPU-bound — build off the event loop
+    pdf_data = await asyncio.to_thread(
+        _build_pdf, report_service.generate_analytics_pdf, _parse_date(start_date), _parse_date(end_date),
     )
     filename = _build_filename("analytics_report", "pdf", start_date, end_date)
     return _pdf_response(pdf_data, filename)
@@ -118,13 +151,17 @@ async def download_analytics(
 # ── Agent Performance CSV ────────────────────────────────────
 @router.get("/agent-performance")
 async def download_agent_performance(
-    db: Session = Depends(get_db),
+    start_date: str | None = Query(None, description="ISO 8601 start date"),
+    end_date: str | None = Query(None, description="ISO 8601 end date"),
     current_user: User = Depends(require_role("admin")),
 ) -> Response:
     """Download agent performance metrics as CSV."""
     logger.info("Admin %s exporting agent performance CSV", current_user.id)
-    csv_data = report_service.generate_agent_performance_csv(db)
-    return _csv_response(csv_data, "agent_performance.csv")
+    csv_data = _stream_csv(
+        report_service.generate_agent_performance_csv, _parse_date(start_date), _parse_date(end_date),
+    )
+    filename = _build_filename("agent_performance", "csv", start_date, end_date)
+    return _csv_response(csv_data, filename)
 
 
 # ── Analytics Summary CSV ────────────────────────────────────
@@ -132,13 +169,55 @@ async def download_agent_performance(
 async def download_analytics_summary(
     start_date: str | None = Query(None, description="ISO 8601 start date"),
     end_date: str | None = Query(None, description="ISO 8601 end date"),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ) -> Response:
     """Download analytics summary as CSV."""
     logger.info("Admin %s exporting analytics summary CSV", current_user.id)
-    csv_data = report_service.generate_analytics_summary_csv(
-        db, _parse_date(start_date), _parse_date(end_date),
+    csv_data = _stream_csv(
+        report_service.generate_analytics_summary_csv, _parse_date(start_date), _parse_date(end_date),
     )
     filename = _build_filename("analytics_summary", "csv", start_date, end_date)
     return _csv_response(csv_data, filename)
+
+
+# ── Background PDF jobs ──────────────────────────────────────
+@router.post("/jobs", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_report_job(
+    kind: str = Query(..., description="analytics or escalations"),
+    start_date: str | None = Query(None, description="ISO 8601 start date"),
+    end_date: str | None = Query(None, description="ISO 8601 end date"),
+    current_user: User = Depends(require_role("admin")),
+) -> ReportJobResponse:
+    """Queue a PDF report build; poll the returned job for the download."""
+    logger.info("Admin %s queued %s report job", current_user.id, kind)
+    try:
+        job_id = report_service.submit_report_job(kind, _parse_date(start_date), _parse_date(end_date))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return ReportJobResponse(job_id=job_id, status="pending")
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobResponse)
+async def get_report_job(
+    job_id: str,
+    current_user: User = Depends(require_role("admin")),
+) -> ReportJobResponse:
+    """Report job status, with a download URL once the PDF is ready."""
+    job = report_service.get_report_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report job not found")
+    job_status, _, error = job
+    download_url = f"{router.prefix}/jobs/{job_id}/download" if job_status == "done" else None
+    return ReportJobResponse(job_id=job_id, status=job_status, download_url=download_url, detail=error)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_report_job(
+    job_id: str,
+    current_user: User = Depends(require_role("admin")),
+) -> FileResponse:
+    """Download a finished report job's PDF."""
+    job = report_service.get_report_job(job_id)
+    if job is None or job[0] != "done":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not ready")
+    return FileResponse(job[1], media_type="application/pdf", filename=f"report_{job_id[:8]}.pdf")
@@ -4,9 +4,10 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.dependencies import get_current_user, require_role
+from app.core.queries import fast_count
 from app.database import get_db
 from app.models.conversation import Conversation, Message
 from app.models.ticket import Ticket, TicketStatus
@@ -27,21 +28,33 @@ router = APIRouter(prefix="/api/tickets", tags=["Tickets"])
 
 # ── Helpers ───────────────────────────────────────────────────
 
-def _ticket_to_response(ticket: Ticket, db: Session) -> TicketResponse:
-    """Enrich a Ticket ORM object with computed fields."""
-    # Customer name
-    customer = db.query(User).filter(User.id == ticket.customer_id).first()
-    customer_name = customer.name if customer else None
+# Relationships read by _ticket_to_response — loaded up front, never per ticket
+_TICKET_RELATIONS = (
+    joinedload(Ticket.customer),
+    joinedload(Ticket.assigned_agent),
+    joinedload(Ticket.conversation),
+)
 
-    # Agent name
-    agent_name = None
-    if ticket.assigned_agent_id:
-        agent = db.query(User).filter(User.id == ticket.assigned_agent_id).first()
-        agent_name = agent.name if agent else None
 
-    # Conversation info
-    conv = db.query(Conversation).filter(Conversation.id == ticket.conversation_id).first()
-    conversation_title = conv.title if conv else None
+def _get_ticket(db: Session, ticket_id: int) -> Ticket | None:
+    """Load a ticket with the relationships _ticket_to_response needs."""
+    return (
+        db.query(Ticket)
+        .options(*_TICKET_RELATIONS)
+        .filter(Ticket.id == ticket_id)
+        .first()
+    )
+
+
+def _ticket_to_response(ticket: Ticket, db: Session) -> TicketResponse:
+    """Enrich a Ticket ORM object with computed fields.
+
+    Names/titles come from the ticket's relationships, so a ticket loaded via
+    ``_get_ticket`` (or already in the identity map) costs no extra lookups.
+    """
+    customer_name = ticket.customer.name if ticket.customer else None
+    agent_name = ticket.assigned_agent.name if ticket.assigned_agent else None
+    conversation_title = ticket.conversation.title if ticket.conversation else None
 
     msg_count = (
         db.query(func.count(Message.id))
@@ -49,21 +62,15 @@ def _ticket_to_response(ticket: Ticket, db: Session) -> TicketResponse:
         .scalar()
     ) or 0
 
-    return TicketResponse(
-        id=ticket.id,
-        conversation_id=ticket.conversation_id,
-        customer_id=ticket.customer_id,
-        assigned_agent_id=ticket.assigned_agent_id,
-        status=ticket.status.value,
-        priority=ticket.priority.value,
-        reason=ticket.reason,
-        created_at=ticket.created_at,
-        resolved_at=ticket.resolved_at,
-        updated_at=ticket.updated_at,
-        customer_name=customer_name,
-        agent_name=agent_name,
-        conversation_title=conversation_title,
-        message_count=msg_count,
+    return TicketResponse.model_validate(ticket).model_copy(
+        update={
+            "status": ticket.status.value,
+            "priority": ticket.priority.value,
+            "customer_name": customer_name,
+            "agent_name": agent_name,
+            "conversation_title": conversation_title,
+            "message_count": msg_count,
+        }
     )
 
 
@@ -90,9 +97,9 @@ async def create_ticket(
         reason=body.reason,
         priority=body.priority,
     )
+    response = _ticket_to_response(ticket, db)
     db.commit()
-    db.refresh(ticket)
-    return _ticket_to_response(ticket, db)
+    return response
 
 
 @router.get("/", response_model=TicketListResponse)
@@ -105,11 +112,7 @@ async def list_tickets(
     current_user: User = Depends(require_role("agent", "admin")),
 ):
     """List tickets. Agents see their assigned tickets; admins see all."""
-    query = db.query(Ticket)
-
-    # Role-based filtering
-    if current_user.role == UserRole.agent:
-        query = query.filter(Ticket.assigned_agent_id == current_user.id)
+    query = ticket_service.visible_tickets(db, current_user)
 
     # Optional filters
     if status:
@@ -125,9 +128,10 @@ async def list_tickets(
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid priority: {priority}")
 
-    total = query.count()
+    total = fast_count(query, Ticket.id)
     tickets = (
         query
+        .options(*_TICKET_RELATIONS)
         .order_by(Ticket.created_at.desc())
         .offset((page - 1) * limit)
         .limit(limit)
@@ -147,7 +151,7 @@ async def get_ticket(
     current_user: User = Depends(get_current_user),
 ):
     """Get a single ticket by ID."""
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = _get_ticket(db, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
@@ -168,7 +172,7 @@ async def update_ticket(
     current_user: User = Depends(require_role("agent", "admin")),
 ):
     """Update ticket status, priority, or assignment."""
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = _get_ticket(db, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
@@ -183,9 +187,9 @@ async def update_ticket(
         priority=body.priority,
         assigned_agent_id=body.assigned_agent_id,
     )
+    response = _ticket_to_response(ticket, db)
     db.commit()
-    db.refresh(ticket)
-    return _ticket_to_response(ticket, db)
+    return response
 
 
 @router.post("/{ticket_id}/respond", response_model=TicketResponse)
@@ -196,7 +200,7 @@ async def respond_to_ticket(
     current_user: User = Depends(require_role("agent", "admin")),
 ):
     """Add an agent response to the ticket's conversation."""
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = _get_ticket(db, ticket_id)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
     if current_user.role == UserRole.agent and ticket.assigned_agent_id != current_user.id:
@@ -207,10 +211,10 @@ async def respond_to_ticket(
         raise HTTPException(status_code=400, detail="Response cannot be empty")
 
     ticket_service.add_agent_response(db, ticket, current_user, content)
+    response = _ticket_to_response(ticket, db)
     db.commit()
-    db.refresh(ticket)
     logger.info("Agent %d responded to ticket %d", current_user.id, ticket_id)
-    return _ticket_to_response(ticket, db)
+    return response
 
 
 @router.delete("/{ticket_id}", status_code=204)
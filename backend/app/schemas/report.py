@@ -0,0 +1,12 @@
+"""Pydantic schemas for background report jobs."""
+
+from pydantic import BaseModel
+
+
+class ReportJobResponse(BaseModel):
+    """State of a background report job."""
+
+    job_id: str
+    status: str  # pending | done | failed
+    download_url: str | None = None
+    detail: str | None = None  # error message once status is failed
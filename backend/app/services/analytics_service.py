@@ -3,16 +3,76 @@
 import logging
 from datetime import datetime, timedelta
 
-from sqlalchemy import case, cast, extract, func, Float, Integer
+from sqlalchemy import case, cast, event, extract, func, true, Float, Integer
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.cache import TTLCache, cached, clear_session_memo
 from app.models.conversation import Conversation
-from app.models.query_log import QueryLog
+from app.models.query_log import EscalationReasonCode, QueryLog
 from app.models.ticket import Ticket, TicketStatus
 from app.models.user import User, UserRole
+from app.services.rollup_service import (
+    query_log_hour_of_day,
+    query_log_rollup,
+    rollup_available,
+    top_queries_rollup,
+)
 
 logger = logging.getLogger(__name__)
 
+# date_trunc units at least as coarse as the rollup's hourly buckets. Endpoints
+# read from the rollups (trends at these intervals, peak hours, top queries)
+# only see activity up to the last background refresh — up to
+# ANALYTICS_ROLLUP_REFRESH_SECONDS behind query_logs, which the result cache
+# invalidation below cannot speed up — and filter dates to whole hours. While
+# a view is missing (migrations not yet run) they scan query_logs instead.
+_ROLLUP_INTERVALS = {"hour", "day", "week", "month", "quarter", "year"}
+
+# Dashboard results, keyed on function + arguments. Dropped after any commit
+# that wrote query logs, tickets, conversations or users, so counts don't lag
+# behind activity handled by this process.
+_cache = TTLCache()
+_dashboard_cache = cached(_cache, lambda: settings.ANALYTICS_CACHE_TTL_SECONDS)
+_TRACKED_MODELS = (QueryLog, Ticket, Conversation, User)
+
+
+def invalidate_cache() -> None:
+    """Drop all cached dashboard results."""
+    _cache.clear()
+
+
+def _mark_stale(session) -> None:
+    session.info["analytics_stale"] = True
+    clear_session_memo(session)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, _flush_context):
+    if any(isinstance(obj, _TRACKED_MODELS) for obj in (*session.new, *session.dirty, *session.deleted)):
+        _mark_stale(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk(orm_execute_state):
+    # insert().returning(), query.update() etc. bypass the flush
+    if orm_execute_state.is_select:
+        return
+    if any(m.class_ in _TRACKED_MODELS for m in orm_execute_state.all_mappers):
+        _mark_stale(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("analytics_stale", False):
+        invalidate_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("analytics_stale", None)
+    clear_session_memo(session)
+
 
 def _date_filter(query, model_col, start_date: datetime | None, end_date: datetime | None):
     """Apply optional date range filter to a query."""
@@ -23,56 +83,95 @@ def _date_filter(query, model_col, start_date: datetime | None, end_date: dateti
     return query
 
 
-def get_overview(db: Session, start_date: datetime | None = None, end_date: datetime | None = None) -> dict:
-    """Aggregate overview metrics for the admin dashboard."""
-    # Query logs stats
-    logs_q = db.query(QueryLog)
-    logs_q = _date_filter(logs_q, QueryLog.created_at, start_date, end_date)
+def _date_label(trunc):
+    """Format a truncated timestamp as ``YYYY-MM-DD`` in SQL, labelled ``date``."""
+    return func.to_char(trunc, "YYYY-MM-DD").label("date")
 
-    total_queries = logs_q.count()
-    total_escalations = logs_q.filter(QueryLog.escalated == True).count()  # noqa: E712
-    escalation_rate = (total_escalations / total_queries * 100) if total_queries > 0 else 0.0
 
-    agg = logs_q.with_entities(
-        func.coalesce(func.avg(QueryLog.confidence_score), 0).label("avg_conf"),
-        func.coalesce(func.avg(QueryLog.response_time_ms), 0).label("avg_rt"),
-        func.sum(case((QueryLog.has_sufficient_evidence == True, 1), else_=0)).label("with_ev"),  # noqa: E712
-    ).first()
+def _rollup_filter(query, start_date: datetime | None, end_date: datetime | None):
+    """Apply optional date range filter to a query over the hourly rollup.
 
-    avg_confidence = float(agg.avg_conf) if agg else 0.0
-    avg_response_time = float(agg.avg_rt) if agg else 0.0
-    queries_with_evidence = int(agg.with_ev) if agg and agg.with_ev else 0
-    evidence_rate = (queries_with_evidence / total_queries * 100) if total_queries > 0 else 0.0
+    Buckets are whole hours, so the range is taken at hour granularity: the
+    bucket containing *start_date* is included, and so is every bucket that
+    starts before *end_date*, but not the hour that starts at it. With
+    hour-aligned dates this agrees with the raw query_logs filter, apart from
+    rows stamped exactly at *end_date*.
+    """
+    if start_date:
+        query = query.filter(query_log_rollup.c.hour >= func.date_trunc("hour", start_date))
+    if end_date:
+        query = query.filter(query_log_rollup.c.hour < end_date)
+    return query
+
+
+@_dashboard_cache
+def get_overview(db: Session, start_date: datetime | None = None, end_date: datetime | None = None) -> dict:
+    """Aggregate overview metrics for the admin dashboard.
+
+    Query-log, conversation and ticket aggregates are computed as three
+    one-row subqueries joined into a single statement (one round-trip).
+    """
+    logs = _date_filter(
+        db.query(
+            func.count(QueryLog.id).label("total"),
+            func.count(QueryLog.id).filter(QueryLog.escalated == True).label("escalations"),  # noqa: E712
+            func.coalesce(func.avg(QueryLog.confidence_score), 0).label("avg_conf"),
+            func.coalesce(func.avg(QueryLog.response_time_ms), 0).label("avg_rt"),
+            func.count(QueryLog.id).filter(QueryLog.has_sufficient_evidence == True).label("with_ev"),  # noqa: E712
+        ),
+        QueryLog.created_at, start_date, end_date,
+    ).subquery()
+
+    convs = _date_filter(
+        db.query(func.count(Conversation.id).label("total")),
+        Conversation.created_at, start_date, end_date,
+    ).subquery()
+
+    tickets = _date_filter(
+        db.query(
+            func.count(Ticket.id).filter(
+                Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
+            ).label("active"),
+            func.count(Ticket.id).filter(
+                Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
+            ).label("resolved"),
+        ),
+        Ticket.created_at, start_date, end_date,
+    ).subquery()
+
+    row = (
+        db.query(
+            logs.c.total, logs.c.escalations, logs.c.avg_conf, logs.c.avg_rt, logs.c.with_ev,
+            convs.c.total.label("conversations"),
+            tickets.c.active, tickets.c.resolved,
+        )
+        .select_from(logs)
+        .join(convs, true())
+        .join(tickets, true())
+        .one()
+    )
 
-    # Conversations
-    convs_q = db.query(Conversation)
-    convs_q = _date_filter(convs_q, Conversation.created_at, start_date, end_date)
-    total_conversations = convs_q.count()
-
-    # Tickets
-    tickets_q = db.query(Ticket)
-    tickets_q = _date_filter(tickets_q, Ticket.created_at, start_date, end_date)
-    active_tickets = tickets_q.filter(
-        Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
-    ).count()
-    resolved_tickets = tickets_q.filter(
-        Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
-    ).count()
+    total_queries = row.total
+    total_escalations = row.escalations
+    escalation_rate = (total_escalations / total_queries * 100) if total_queries > 0 else 0.0
+    queries_with_evidence = row.with_ev
+    evidence_rate = (queries_with_evidence / total_queries * 100) if total_queries > 0 else 0.0
 
     return {
         "total_queries": total_queries,
-        "total_conversations": total_conversations,
+        "total_conversations": row.conversations,
         "total_escalations": total_escalations,
         "escalation_rate": round(escalation_rate, 2),
-        "avg_confidence_score": round(avg_confidence, 4),
-        "avg_response_time_ms": round(avg_response_time, 1),
+        "avg_confidence_score": round(float(row.avg_conf), 4),
+        "avg_response_time_ms": round(float(row.avg_rt), 1),
         "queries_with_evidence": queries_with_evidence,
         "evidence_rate": round(evidence_rate, 2),
-        "active_tickets": active_tickets,
-        "resolved_tickets": resolved_tickets,
+        "active_tickets": row.active,
+        "resolved_tickets": row.resolved,
     }
 
 
+@_dashboard_cache
 def get_query_trends(
     db: Session,
     start_date: datetime | None = None,
@@ -80,24 +179,33 @@ def get_query_trends(
     interval: str = "day",
 ) -> list[dict]:
     """Query count grouped by time interval."""
-    # Use date_trunc for PostgreSQL; fall back to date() for SQLite
-    try:
-        trunc = func.date_trunc(interval, QueryLog.created_at)
-    except Exception:
-        trunc = func.date(QueryLog.created_at)
-
-    q = db.query(
-        trunc.label("date"),
-        func.count(QueryLog.id).label("query_count"),
-        func.sum(case((QueryLog.escalated == True, 1), else_=0)).label("escalation_count"),  # noqa: E712
-    ).group_by(trunc).order_by(trunc)
+    if interval in _ROLLUP_INTERVALS and rollup_available(db, query_log_rollup):
+        trunc = func.date_trunc(interval, query_log_rollup.c.hour)
+        q = db.query(
+            _date_label(trunc),
+            func.sum(query_log_rollup.c.n).label("query_count"),
+            func.sum(query_log_rollup.c.esc).label("escalation_count"),
+        ).group_by(trunc).order_by(trunc)
+        q = _rollup_filter(q, start_date, end_date)
+    else:
+        # Use date_trunc for PostgreSQL; fall back to date() for SQLite
+        try:
+            trunc = func.date_trunc(interval, QueryLog.created_at)
+        except Exception:
+            trunc = func.date(QueryLog.created_at)
+
+        q = db.query(
+            _date_label(trunc),
+            func.count(QueryLog.id).label("query_count"),
+            func.sum(case((QueryLog.escalated == True, 1), else_=0)).label("escalation_count"),  # noqa: E712
+        ).group_by(trunc).order_by(trunc)
+        q = _date_filter(q, QueryLog.created_at, start_date, end_date)
 
-    q = _date_filter(q, QueryLog.created_at, start_date, end_date)
     rows = q.all()
 
     return [
         {
-            "date": str(r.date)[:10] if r.date else "",
+            "date": r.date or "",
             "query_count": int(r.query_count),
             "escalation_count": int(r.escalation_count) if r.escalation_count else 0,
         }
@@ -105,12 +213,23 @@ def get_query_trends(
     ]
 
 
+@_dashboard_cache
 def get_peak_hours(db: Session) -> list[dict]:
-    """Query count grouped by hour of day."""
-    q = db.query(
-        extract("hour", QueryLog.created_at).label("hour"),
-        func.count(QueryLog.id).label("query_count"),
-    ).group_by("hour").order_by("hour")
+    """Query count grouped by hour of day (at most 24 precomputed rows).
+
+    Served from the mv_query_log_hourly rollup, as of its last refresh, or
+    grouped live from query_logs while the view doesn't exist.
+    """
+    if rollup_available(db, query_log_hour_of_day):
+        q = db.query(
+            query_log_hour_of_day.c.hour_of_day.label("hour"),
+            query_log_hour_of_day.c.n.label("query_count"),
+        ).order_by(query_log_hour_of_day.c.hour_of_day)
+    else:
+        q = db.query(
+            extract("hour", QueryLog.created_at).label("hour"),
+            func.count(QueryLog.id).label("query_count"),
+        ).group_by("hour").order_by("hour")
 
     return [
         {"hour": int(r.hour), "query_count": int(r.query_count)}
@@ -118,6 +237,7 @@ def get_peak_hours(db: Session) -> list[dict]:
     ]
 
 
+@_dashboard_cache
 def get_response_performance(
     db: Session,
     start_date: datetime | None = None,
@@ -159,6 +279,7 @@ def get_response_performance(
     }
 
 
+@_dashboard_cache
 def get_confidence_trend(
     db: Session,
     start_date: datetime | None = None,
@@ -166,76 +287,89 @@ def get_confidence_trend(
     interval: str = "day",
 ) -> list[dict]:
     """Average confidence score over time."""
-    try:
-        trunc = func.date_trunc(interval, QueryLog.created_at)
-    except Exception:
-        trunc = func.date(QueryLog.created_at)
-
-    q = db.query(
-        trunc.label("date"),
-        func.avg(QueryLog.confidence_score).label("avg_confidence"),
-    ).group_by(trunc).order_by(trunc)
-
-    q = _date_filter(q, QueryLog.created_at, start_date, end_date)
+    if interval in _ROLLUP_INTERVALS and rollup_available(db, query_log_rollup):
+        trunc = func.date_trunc(interval, query_log_rollup.c.hour)
+        q = db.query(
+            _date_label(trunc),
+            (
+                func.sum(query_log_rollup.c.conf_sum) / func.nullif(func.sum(query_log_rollup.c.conf_n), 0)
+            ).label("avg_confidence"),
+        ).group_by(trunc).order_by(trunc)
+        q = _rollup_filter(q, start_date, end_date)
+    else:
+        try:
+            trunc = func.date_trunc(interval, QueryLog.created_at)
+        except Exception:
+            trunc = func.date(QueryLog.created_at)
+
+        q = db.query(
+            _date_label(trunc),
+            func.avg(QueryLog.confidence_score).label("avg_confidence"),
+        ).group_by(trunc).order_by(trunc)
+        q = _date_filter(q, QueryLog.created_at, start_date, end_date)
 
     return [
         {
-            "date": str(r.date)[:10] if r.date else "",
+            "date": r.date or "",
             "avg_confidence": round(float(r.avg_confidence), 4) if r.avg_confidence else 0.0,
         }
         for r in q.all()
     ]
 
 
+@_dashboard_cache
 def get_escalation_metrics(
     db: Session,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
 ) -> dict:
     """Escalation breakdown and resolution stats."""
-    # From QueryLog
-    logs_q = db.query(QueryLog)
-    logs_q = _date_filter(logs_q, QueryLog.created_at, start_date, end_date)
-
-    total_queries = logs_q.count()
-    total_escalations = logs_q.filter(QueryLog.escalated == True).count()  # noqa: E712
+    # From QueryLog — totals and per-reason counts in one pass
+    escalated = QueryLog.escalated == True  # noqa: E712
+    logs = _date_filter(
+        db.query(
+            func.count(QueryLog.id).label("total"),
+            func.count(QueryLog.id).filter(escalated).label("escalations"),
+            func.count(QueryLog.id).filter(
+                escalated, QueryLog.escalation_reason_code == EscalationReasonCode.low_confidence
+            ).label("low_conf"),
+            func.count(QueryLog.id).filter(
+                escalated, QueryLog.escalation_reason_code == EscalationReasonCode.customer_requested
+            ).label("customer_req"),
+        ),
+        QueryLog.created_at, start_date, end_date,
+    ).one()
+
+    total_queries = logs.total
+    total_escalations = logs.escalations
     escalation_rate = (total_escalations / total_queries * 100) if total_queries > 0 else 0.0
 
     # Breakdown by reason
-    low_conf = logs_q.filter(
-        QueryLog.escalated == True,  # noqa: E712
-        QueryLog.escalation_reason.ilike("%confidence%"),
-    ).count()
-
-    customer_req = logs_q.filter(
-        QueryLog.escalated == True,  # noqa: E712
-        QueryLog.escalation_reason.ilike("%customer%"),
-    ).count()
-
+    low_conf = logs.low_conf
+    customer_req = logs.customer_req
     other_esc = total_escalations - low_conf - customer_req
 
-    # From Tickets
-    tickets_q = db.query(Ticket)
-    tickets_q = _date_filter(tickets_q, Ticket.created_at, start_date, end_date)
-
-    resolved_q = tickets_q.filter(
-        Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
-    )
-    resolved_count = resolved_q.count()
-    pending_count = tickets_q.filter(
-        Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
-    ).count()
-
-    # Average resolution time (for resolved tickets with resolved_at set)
-    avg_res = resolved_q.filter(Ticket.resolved_at.isnot(None)).with_entities(
-        func.avg(
-            extract("epoch", Ticket.resolved_at) - extract("epoch", Ticket.created_at)
-        ).label("avg_seconds")
-    ).first()
+    # From Tickets — counts and average resolution time in one pass
+    resolved_statuses = Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
+    ticket_counts = _date_filter(
+        db.query(
+            func.count(Ticket.id).filter(resolved_statuses).label("resolved"),
+            func.count(Ticket.id).filter(
+                Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
+            ).label("pending"),
+            # Average resolution time (for resolved tickets with resolved_at set)
+            func.avg(
+                extract("epoch", Ticket.resolved_at) - extract("epoch", Ticket.created_at)
+            ).filter(resolved_statuses, Ticket.resolved_at.isnot(None)).label("avg_seconds"),
+        ),
+        Ticket.created_at, start_date, end_date,
+    ).one()
+    resolved_count = ticket_counts.resolved
+    pending_count = ticket_counts.pending
 
     avg_resolution_hours = None
-    if avg_res and avg_res.avg_seconds:
-        avg_resolution_hours = round(float(avg_res.avg_seconds) / 3600, 1)
+    if ticket_counts.avg_seconds:
+        avg_resolution_hours = round(float(ticket_counts.avg_seconds) / 3600, 1)
 
     return {
         "total_escalations": total_escalations,
@@ -251,6 +385,7 @@ def get_escalation_metrics(
     }
 
 
+@_dashboard_cache
 def get_escalation_trend(
     db: Session,
     start_date: datetime | None = None,
@@ -258,79 +393,115 @@ def get_escalation_trend(
     interval: str = "day",
 ) -> list[dict]:
     """Escalation count over time."""
-    try:
-        trunc = func.date_trunc(interval, QueryLog.created_at)
-    except Exception:
-        trunc = func.date(QueryLog.created_at)
-
-    q = db.query(
-        trunc.label("date"),
-        func.sum(case((QueryLog.escalated == True, 1), else_=0)).label("escalation_count"),  # noqa: E712
-    ).group_by(trunc).order_by(trunc)
-
-    q = _date_filter(q, QueryLog.created_at, start_date, end_date)
+    if interval in _ROLLUP_INTERVALS and rollup_available(db, query_log_rollup):
+        trunc = func.date_trunc(interval, query_log_rollup.c.hour)
+        q = db.query(
+            _date_label(trunc),
+            func.sum(query_log_rollup.c.esc).label("escalation_count"),
+        ).group_by(trunc).order_by(trunc)
+        q = _rollup_filter(q, start_date, end_date)
+    else:
+        try:
+            trunc = func.date_trunc(interval, QueryLog.created_at)
+        except Exception:
+            trunc = func.date(QueryLog.created_at)
+
+        q = db.query(
+            _date_label(trunc),
+            func.sum(case((QueryLog.escalated == True, 1), else_=0)).label("escalation_count"),  # noqa: E712
+        ).group_by(trunc).order_by(trunc)
+        q = _date_filter(q, QueryLog.created_at, start_date, end_date)
 
     return [
         {
-            "date": str(r.date)[:10] if r.date else "",
+            "date": r.date or "",
             "escalation_count": int(r.escalation_count) if r.escalation_count else 0,
         }
         for r in q.all()
     ]
 
 
-def get_agent_performance(db: Session) -> list[dict]:
-    """Per-agent ticket metrics."""
-    agents = db.query(User).filter(User.role == UserRole.agent, User.is_active == True).all()  # noqa: E712
-
-    result = []
-    for agent in agents:
-        tickets_q = db.query(Ticket).filter(Ticket.assigned_agent_id == agent.id)
-        assigned = tickets_q.count()
-        resolved_q = tickets_q.filter(
-            Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
-        )
-        resolved = resolved_q.count()
-        pending = tickets_q.filter(
-            Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
-        ).count()
+@_dashboard_cache
+def get_agent_performance(
+    db: Session,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> list[dict]:
+    """Per-agent ticket metrics (one GROUP BY over active agents).
 
-        # Average resolution time
-        avg_res = resolved_q.filter(Ticket.resolved_at.isnot(None)).with_entities(
+    The date range limits which tickets are counted (by created_at); agents
+    without tickets in the range are still listed with zero counts.
+    """
+    resolved = Ticket.status.in_([TicketStatus.resolved, TicketStatus.closed])
+    ticket_join = Ticket.assigned_agent_id == User.id
+    if start_date:
+        ticket_join &= Ticket.created_at >= start_date
+    if end_date:
+        ticket_join &= Ticket.created_at <= end_date
+    rows = (
+        db.query(
+            User.id,
+            User.name,
+            func.count(Ticket.id).label("assigned"),
+            func.count(Ticket.id).filter(resolved).label("resolved"),
+            func.count(Ticket.id).filter(
+                Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress])
+            ).label("pending"),
+            # Average resolution time over resolved tickets with resolved_at set
             func.avg(
                 extract("epoch", Ticket.resolved_at) - extract("epoch", Ticket.created_at)
-            ).label("avg_seconds")
-        ).first()
+            ).filter(resolved, Ticket.resolved_at.isnot(None)).label("avg_seconds"),
+        )
+        .select_from(User)
+        .outerjoin(Ticket, ticket_join)
+        .filter(User.role == UserRole.agent, User.is_active == True)  # noqa: E712
+        .group_by(User.id, User.name)
+        .order_by(User.id)
+        .all()
+    )
 
+    result = []
+    for r in rows:
         avg_hours = None
-        if avg_res and avg_res.avg_seconds:
-            avg_hours = round(float(avg_res.avg_seconds) / 3600, 1)
+        if r.avg_seconds:
+            avg_hours = round(float(r.avg_seconds) / 3600, 1)
 
         result.append({
-            "agent_id": agent.id,
-            "agent_name": agent.name,
-            "tickets_assigned": assigned,
-            "tickets_resolved": resolved,
+            "agent_id": r.id,
+            "agent_name": r.name,
+            "tickets_assigned": r.assigned,
+            "tickets_resolved": r.resolved,
             "avg_resolution_time_hours": avg_hours,
-            "pending_tickets": pending,
+            "pending_tickets": r.pending,
         })
 
     return result
 
 
+@_dashboard_cache
 def get_top_queries(db: Session, limit: int = 10) -> list[dict]:
-    """Most frequently asked questions (grouped by exact query text)."""
-    rows = (
-        db.query(
-            QueryLog.query_text,
-            func.count(QueryLog.id).label("count"),
-            func.avg(QueryLog.confidence_score).label("avg_confidence"),
+    """Most frequently asked questions (grouped by exact query text).
+
+    Read from the precomputed mv_top_queries rollup, as of its last refresh,
+    or grouped live on the stored query_text hash while the view doesn't exist.
+    """
+    if rollup_available(db, top_queries_rollup):
+        q = db.query(
+            top_queries_rollup.c.query_text,
+            top_queries_rollup.c.cnt.label("count"),
+            top_queries_rollup.c.avg_conf.label("avg_confidence"),
+        ).order_by(top_queries_rollup.c.cnt.desc())
+    else:
+        q = (
+            db.query(
+                func.min(QueryLog.query_text).label("query_text"),
+                func.count(QueryLog.id).label("count"),
+                func.avg(QueryLog.confidence_score).label("avg_confidence"),
+            )
+            .group_by(QueryLog.query_text_hash)
+            .order_by(func.count(QueryLog.id).desc())
         )
-        .group_by(QueryLog.query_text)
-        .order_by(func.count(QueryLog.id).desc())
-        .limit(limit)
-        .all()
-    )
+    rows = q.limit(limit).all()
 
     return [
         {
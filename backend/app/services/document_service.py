@@ -1,20 +1,36 @@
 """Document service — upload, ingest, list, delete."""
 
+import asyncio
+import hashlib
 import logging
 import os
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from uuid import uuid4
 
+import anyio
 from fastapi import UploadFile
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import settings
+from app.core.queries import fast_count
 from app.models.document import Document, DocumentChunk, DocumentStatus
 from app.rag.vector_store import delete_document_vectors
 
 logger = logging.getLogger(__name__)
 
 ALLOWED_EXTENSIONS = {".pdf"}
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB reads/writes while streaming uploads to disk
+
+# Ingestion gets its own bounded pool so CPU-heavy parse/embed work neither
+# occupies the threadpool serving requests nor runs unbounded in parallel.
+_ingestion_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.INGESTION_WORKERS),
+    thread_name_prefix="ingestion",
+)
 
 
 def _upload_dir() -> Path:
@@ -24,9 +40,13 @@ def _upload_dir() -> Path:
     return path
 
 
-async def upload_document(db: Session, file: UploadFile, user_id: int) -> Document:
+async def upload_document(db: Session, file: UploadFile, user_id: int) -> tuple[Document, bool]:
     """Save uploaded PDF and create DB record (status=processing).
 
+    Returns ``(document, created)``. If an identical file (same SHA-256) is
+    already stored and not failed, that document is returned with
+    ``created=False`` and the new copy is discarded, so nothing is re-embedded.
+
     This returns immediately — ingestion runs separately via run_ingestion().
     """
     # Validate
@@ -35,18 +55,31 @@ async def upload_document(db: Session, file: UploadFile, user_id: int) -> Docume
     if ext not in ALLOWED_EXTENSIONS:
         raise ValueError(f"Only PDF files are allowed (got {ext})")
 
-    # Save to disk
-    upload_path = _upload_dir() / filename
-    counter = 1
-    while upload_path.exists():
-        stem = os.path.splitext(filename)[0]
-        upload_path = _upload_dir() / f"{stem}_{counter}{ext}"
-        counter += 1
-
-    with open(upload_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-
-    file_size = upload_path.stat().st_size
+    # Save to disk under a unique name; O_EXCL makes the create atomic
+    upload_path = _upload_dir() / f"{uuid4().hex}_{Path(filename).name}"
+    fd = os.open(upload_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o640)
+
+    # Stream in large chunks without blocking the event loop, hashing as we go
+    file_size = 0
+    digest = hashlib.sha256()
+    async with anyio.wrap_file(os.fdopen(fd, "wb")) as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await f.write(chunk)
+            file_size += len(chunk)
+    content_sha256 = digest.hexdigest()
+
+    existing = _find_by_hash(db, content_sha256)
+    if existing is not None and existing.status != DocumentStatus.failed:
+        upload_path.unlink(missing_ok=True)
+        logger.info("Upload matches document id=%d — skipping ingestion", existing.id)
+        return existing, False
+    if existing is not None:
+        # A failed document's hash is released so the same file can be retried;
+        # flushed first so the unique index is free for the insert below, and
+        # committed together with it
+        existing.content_sha256 = None
+        db.flush()
 
     # If ingestion is skipped, mark as indexed immediately (no embeddings)
     initial_status = DocumentStatus.processing
@@ -58,18 +91,41 @@ async def upload_document(db: Session, file: UploadFile, user_id: int) -> Docume
         title=filename,
         file_path=str(upload_path),
         file_size=file_size,
+        content_sha256=content_sha256,
         status=initial_status,
         uploaded_by=user_id,
     )
     db.add(doc)
-    db.commit()
-    db.refresh(doc)
+    try:
+        db.commit()
+    except IntegrityError:
+        # An identical upload committed first
+        db.rollback()
+        upload_path.unlink(missing_ok=True)
+        existing = _find_by_hash(db, content_sha256)
+        if existing is None or existing.status == DocumentStatus.failed:
+            raise
+        return existing, False
+    # PK and column defaults are already populated (expire_on_commit=False);
+    # a brand-new document has no chunks, so skip the deferred count query too
+    set_committed_value(doc, "chunk_count", 0)
     logger.info("Document id=%d saved to %s", doc.id, upload_path)
-    return doc
+    return doc, True
+
+
+def _find_by_hash(db: Session, content_sha256: str) -> Document | None:
+    """Return the stored document with this content hash, if any (failed ones included)."""
+    return db.query(Document).filter(Document.content_sha256 == content_sha256).first()
+
+
+def submit_ingestion(document_id: int, file_path: str) -> None:
+    """Queue a document for ingestion on the dedicated ingestion pool."""
+    _ingestion_pool.submit(run_ingestion, document_id, file_path)
+    logger.info("Queued ingestion for document id=%d", document_id)
 
 
 def run_ingestion(document_id: int, file_path: str) -> None:
-    """Run the RAG ingestion pipeline in a background task.
+    """Run the RAG ingestion pipeline (executed on the ingestion pool).
 
     Uses its own DB session so it's independent of the request lifecycle.
     This is safe to crash without affecting the running server.
@@ -90,17 +146,19 @@ def run_ingestion(document_id: int, file_path: str) -> None:
             logger.error("Document id=%d not found after ingestion", document_id)
             return
 
-        # Save chunks to DB
-        for i, point_id in enumerate(result["point_ids"]):
-            chunk_data = result["chunks"][i]
-            chunk = DocumentChunk(
-                document_id=document_id,
-                chunk_index=i,
-                chunk_text=chunk_data["text"],
-                page_number=chunk_data.get("page_number"),
-                embedding_id=point_id,
-            )
-            db.add(chunk)
+        # Save chunks to DB — one multi-row INSERT instead of one per chunk
+        chunk_rows = [
+            {
+                "document_id": document_id,
+                "chunk_index": i,
+                "chunk_text": chunk_data["text"],
+                "page_number": chunk_data.get("page_number"),
+                "embedding_id": point_id,
+            }
+            for i, (point_id, chunk_data) in enumerate(zip(result["point_ids"], result["chunks"]))
+        ]
+        if chunk_rows:
+            db.execute(insert(DocumentChunk), chunk_rows)
 
         doc.page_count = result["page_count"]
         doc.status = DocumentStatus.indexed
@@ -126,16 +184,26 @@ def get_documents(
     page: int = 1,
     limit: int = 20,
 ) -> tuple[list[Document], int]:
-    """Return paginated list of documents with chunk counts."""
-    total = db.query(Document).count()
-    docs = (
-        db.query(Document)
+    """Return paginated list of documents with chunk counts.
+
+    The total comes back with the page via ``COUNT(*) OVER ()``; only a page
+    past the end (no rows to carry it) needs a separate count.
+    """
+    rows = (
+        db.query(Document, func.count().over().label("total"))
+        .options(undefer(Document.chunk_count))
         .order_by(Document.created_at.desc())
         .offset((page - 1) * limit)
         .limit(limit)
         .all()
     )
-    return docs, total
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        total = fast_count(db.query(Document), Document.id)
+    else:
+        total = 0
+    return [r.Document for r in rows], total
 
 
 def get_document_by_id(db: Session, document_id: int) -> Document | None:
@@ -143,26 +211,46 @@ def get_document_by_id(db: Session, document_id: int) -> Document | None:
     return db.query(Document).filter(Document.id == document_id).first()
 
 
-def delete_document(db: Session, document_id: int) -> None:
-    """Delete document from DB, Qdrant, and disk."""
+async def delete_document(db: Session, document_id: int) -> None:
+    """Delete document from DB, Qdrant, and disk.
+
+    The rows go first, on the request's own session: only once that commit
+    has succeeded are the irreversible Qdrant and disk deletes started. Those
+    two are independent and best-effort, so they run concurrently in worker
+    threads.
+    """
     doc = get_document_by_id(db, document_id)
     if doc is None:
         raise ValueError("Document not found")
 
-    # Delete vectors from Qdrant (best-effort)
+    file_path = doc.file_path
+    _delete_rows(db, doc)
+
+    await asyncio.gather(
+        asyncio.to_thread(_delete_vectors, document_id),
+        asyncio.to_thread(_delete_file, file_path),
+    )
+    logger.info("Deleted document id=%d", document_id)
+
+
+def _delete_vectors(document_id: int) -> None:
+    """Delete vectors from Qdrant in one filter-based call (best-effort)."""
     try:
         delete_document_vectors(document_id)
     except Exception as exc:
         logger.warning("Failed to delete Qdrant vectors for doc %d: %s", document_id, exc)
 
-    # Delete file from disk (best-effort)
+
+def _delete_file(file_path: str) -> None:
+    """Delete the uploaded file from disk (best-effort)."""
     try:
-        if os.path.exists(doc.file_path):
-            os.remove(doc.file_path)
+        Path(file_path).unlink(missing_ok=True)
     except OSError as exc:
-        logger.warning("Failed to delete file %s: %s", doc.file_path, exc)
+        logger.warning("Failed to delete file %s: %s", file_path, exc)
 
-    # Delete from DB (chunks cascade)
+
+def _delete_rows(db: Session, doc: Document) -> None:
+    """Delete from DB — chunks in a single statement rather than one DELETE per row."""
+    db.execute(delete(DocumentChunk).where(DocumentChunk.document_id == doc.id))
     db.delete(doc)
     db.commit()
-    logger.info("Deleted document id=%d", document_id)
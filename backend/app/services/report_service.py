@@ -3,7 +3,14 @@
 import csv
 import io
 import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from uuid import uuid4
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -17,8 +24,12 @@ from reportlab.platypus import (
     TableStyle,
     PageBreak,
 )
+from sqlalchemy import extract, func
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.core.queries import fast_count
+from app.database import SessionLocal
 from app.models.query_log import QueryLog
 from app.models.ticket import Ticket, TicketStatus
 from app.models.user import User, UserRole
@@ -39,83 +50,139 @@ def _date_filter(query, col, start: datetime | None, end: datetime | None):
     return query
 
 
+# to_char() pattern matching strftime("%Y-%m-%d %H:%M:%S")
+_SQL_TIMESTAMP = "YYYY-MM-DD HH24:MI:SS"
+
+# CSV generators yield text in chunks of this many rows, so exports stream
+# with bounded memory instead of being built up as one string.
+_CSV_FLUSH_ROWS = 1000
+
+
+def _drain(buffer: io.StringIO) -> str:
+    """Return what has been written to *buffer* and reset it for reuse."""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
+
+
+def _write_batches(buffer: io.StringIO, rows: Iterable[tuple]) -> Iterator[str]:
+    """Write *rows* with one ``writerows`` call per batch, yielding each batch."""
+    writer = csv.writer(buffer)
+    rows = iter(rows)
+    while batch := list(islice(rows, _CSV_FLUSH_ROWS)):
+        writer.writerows(batch)
+        yield _drain(buffer)
+
+
 def generate_query_log_csv(
     db: Session,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> str:
-    """Export query logs as CSV string."""
-    q = db.query(QueryLog).order_by(QueryLog.created_at.desc())
+) -> Iterator[str]:
+    """Export query logs as CSV, yielded in chunks."""
+    # Plain column rows; timestamps and the response preview are formatted in SQL
+    q = db.query(
+        QueryLog.id,
+        func.to_char(QueryLog.created_at, _SQL_TIMESTAMP).label("created"),
+        QueryLog.query_text,
+        func.left(QueryLog.response_text, 200).label("response_preview"),
+        QueryLog.confidence_score,
+        QueryLog.sources_count,
+        QueryLog.escalated,
+        QueryLog.escalation_reason,
+        QueryLog.response_time_ms,
+        QueryLog.has_sufficient_evidence,
+    ).order_by(QueryLog.created_at.desc())
     q = _date_filter(q, QueryLog.created_at, start_date, end_date)
-    rows = q.all()
 
     output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
+    csv.writer(output).writerow([
         "ID", "Date", "Query", "Response", "Confidence",
         "Sources", "Escalated", "Escalation Reason",
         "Response Time (ms)", "Has Evidence",
     ])
+    yield _drain(output)
 
-    for r in rows:
-        writer.writerow([
+    yield from _write_batches(output, (
+        (
             r.id,
-            r.created_at.strftime("%Y-%m-%d %H:%M:%S") if r.created_at else "",
+            r.created or "",
             r.query_text,
-            r.response_text[:200] if r.response_text else "",
+            r.response_preview or "",
             round(r.confidence_score, 4) if r.confidence_score is not None else "",
             r.sources_count,
             "Yes" if r.escalated else "No",
             r.escalation_reason or "",
             r.response_time_ms or "",
             "Yes" if r.has_sufficient_evidence else "No",
-        ])
-
-    return output.getvalue()
+        )
+        for r in q.yield_per(_CSV_FLUSH_ROWS)
+    ))
 
 
 def generate_escalation_csv(
     db: Session,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> str:
-    """Export escalated tickets as CSV string."""
-    q = db.query(Ticket).order_by(Ticket.created_at.desc())
+) -> Iterator[str]:
+    """Export escalated tickets as CSV, yielded in chunks."""
+    q = db.query(
+        Ticket.id,
+        Ticket.customer_id,
+        Ticket.status,
+        Ticket.priority,
+        Ticket.reason,
+        Ticket.assigned_agent_id,
+        func.to_char(Ticket.created_at, _SQL_TIMESTAMP).label("created"),
+        func.to_char(Ticket.resolved_at, _SQL_TIMESTAMP).label("resolved"),
+        _resolution_seconds().label("resolution_seconds"),
+    ).order_by(Ticket.created_at.desc())
     q = _date_filter(q, Ticket.created_at, start_date, end_date)
-    tickets = q.all()
 
     output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
+    csv.writer(output).writerow([
         "Ticket ID", "Customer ID", "Status", "Priority",
         "Reason", "Agent ID", "Created", "Resolved",
         "Resolution Time (hrs)",
     ])
+    yield _drain(output)
 
-    for t in tickets:
-        res_hours = ""
-        if t.resolved_at and t.created_at:
-            delta = (t.resolved_at - t.created_at).total_seconds() / 3600
-            res_hours = round(delta, 1)
-
-        writer.writerow([
+    yield from _write_batches(output, (
+        (
             t.id,
             t.customer_id,
             t.status.value,
             t.priority.value,
             t.reason or "",
             t.assigned_agent_id or "",
-            t.created_at.strftime("%Y-%m-%d %H:%M:%S") if t.created_at else "",
-            t.resolved_at.strftime("%Y-%m-%d %H:%M:%S") if t.resolved_at else "",
-            res_hours,
-        ])
+            t.created or "",
+            t.resolved or "",
+            _resolution_hours(t.resolution_seconds),
+        )
+        for t in q.yield_per(_CSV_FLUSH_ROWS)
+    ))
+
 
-    return output.getvalue()
+def _resolution_seconds():
+    """SQL expression: seconds from creation to resolution (NULL while unresolved)."""
+    return extract("epoch", Ticket.resolved_at - Ticket.created_at)
 
 
-def generate_agent_performance_csv(db: Session) -> str:
-    """Export agent performance metrics as CSV string."""
-    agents = analytics_service.get_agent_performance(db)
+def _resolution_hours(seconds) -> float | str:
+    """Hours from creation to resolution, or "" while unresolved."""
+    if seconds is None:
+        return ""
+    return round(float(seconds) / 3600, 1)
+
+
+def generate_agent_performance_csv(
+    db: Session,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> Iterator[str]:
+    """Export agent performance metrics as CSV (one chunk per agent list)."""
+    agents = analytics_service.get_agent_performance(db, start_date, end_date)
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -134,62 +201,62 @@ def generate_agent_performance_csv(db: Session) -> str:
             a["avg_resolution_time_hours"] or "",
         ])
 
-    return output.getvalue()
+    yield _drain(output)
 
 
 def generate_analytics_summary_csv(
     db: Session,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
-) -> str:
-    """Export analytics overview + trends as CSV string."""
+) -> Iterator[str]:
+    """Export analytics overview + trends as CSV."""
     overview = analytics_service.get_overview(db, start_date, end_date)
     perf = analytics_service.get_response_performance(db, start_date, end_date)
     esc = analytics_service.get_escalation_metrics(db, start_date, end_date)
     trends = analytics_service.get_query_trends(db, start_date, end_date, interval="day")
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Section 1: Overview
-    writer.writerow(["=== Overview Metrics ==="])
-    writer.writerow(["Metric", "Value"])
-    writer.writerow(["Total Queries", overview["total_queries"]])
-    writer.writerow(["Total Conversations", overview["total_conversations"]])
-    writer.writerow(["Total Escalations", overview["total_escalations"]])
-    writer.writerow(["Escalation Rate (%)", overview["escalation_rate"]])
-    writer.writerow(["Avg Confidence Score", overview["avg_confidence_score"]])
-    writer.writerow(["Avg Response Time (ms)", overview["avg_response_time_ms"]])
-    writer.writerow(["Queries with Evidence", overview["queries_with_evidence"]])
-    writer.writerow(["Evidence Rate (%)", overview["evidence_rate"]])
-    writer.writerow(["Active Tickets", overview["active_tickets"]])
-    writer.writerow(["Resolved Tickets", overview["resolved_tickets"]])
-    writer.writerow([])
-
-    # Section 2: Confidence Distribution
-    writer.writerow(["=== Confidence Distribution ==="])
-    writer.writerow(["Level", "Count"])
-    writer.writerow(["High (>=0.7)", perf["confidence_distribution"]["high"]])
-    writer.writerow(["Medium (0.4-0.7)", perf["confidence_distribution"]["medium"]])
-    writer.writerow(["Low (<0.4)", perf["confidence_distribution"]["low"]])
-    writer.writerow([])
-
-    # Section 3: Escalation Breakdown
-    writer.writerow(["=== Escalation Breakdown ==="])
-    writer.writerow(["Reason", "Count"])
-    writer.writerow(["Low Confidence", esc["by_reason"]["low_confidence"]])
-    writer.writerow(["Customer Requested", esc["by_reason"]["customer_requested"]])
-    writer.writerow(["Other", esc["by_reason"]["other"]])
-    writer.writerow([])
+    dist = perf["confidence_distribution"]
+    rows: list[list] = [
+        # Section 1: Overview
+        ["=== Overview Metrics ==="],
+        ["Metric", "Value"],
+        ["Total Queries", overview["total_queries"]],
+        ["Total Conversations", overview["total_conversations"]],
+        ["Total Escalations", overview["total_escalations"]],
+        ["Escalation Rate (%)", overview["escalation_rate"]],
+        ["Avg Confidence Score", overview["avg_confidence_score"]],
+        ["Avg Response Time (ms)", overview["avg_response_time_ms"]],
+        ["Queries with Evidence", overview["queries_with_evidence"]],
+        ["Evidence Rate (%)", overview["evidence_rate"]],
+        ["Active Tickets", overview["active_tickets"]],
+        ["Resolved Tickets", overview["resolved_tickets"]],
+        [],
+        # Section 2: Confidence Distribution
+        ["=== Confidence Distribution ==="],
+        ["Level", "Count"],
+        ["High (>=0.7)", dist["high"]],
+        ["Medium (0.4-0.7)", dist["medium"]],
+        ["Low (<0.4)", dist["low"]],
+        [],
+        # Section 3: Escalation Breakdown
+        ["=== Escalation Breakdown ==="],
+        ["Reason", "Count"],
+        ["Low Confidence", esc["by_reason"]["low_confidence"]],
+        ["Customer Requested", esc["by_reason"]["customer_requested"]],
+        ["Other", esc["by_reason"]["other"]],
+        [],
+    ]
 
     # Section 4: Daily Trends
     if trends:
-        writer.writerow(["=== Daily Query Trends ==="])
-        writer.writerow(["Date", "Queries", "Escalations"])
-        for t in trends:
-            writer.writerow([t["date"], t["query_count"], t["escalation_count"]])
+        rows.append(["=== Daily Query Trends ==="])
+        rows.append(["Date", "Queries", "Escalations"])
+        rows.extend([t["date"], t["query_count"], t["escalation_count"]] for t in trends)
 
-    return output.getvalue()
+    # Every section goes through one writerows() call and one buffer flush
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    yield output.getvalue()
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -237,34 +304,61 @@ _BODY_STYLE = ParagraphStyle(
 )
 
 
-def _make_table(headers: list[str], rows: list[list], col_widths=None) -> Table:
-    """Create a styled ReportLab table."""
-    data = [headers] + rows
-    t = Table(data, colWidths=col_widths, repeatRows=1)
-
-    style_cmds = [
-        # Header row
-        ("BACKGROUND", (0, 0), (-1, 0), _BRAND_ORANGE),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("FONTSIZE", (0, 0), (-1, 0), 10),
-        ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-        ("TOPPADDING", (0, 0), (-1, 0), 8),
-        # All cells
-        ("FONTSIZE", (0, 1), (-1, -1), 9),
-        ("TOPPADDING", (0, 1), (-1, -1), 5),
-        ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
-    ]
-
+# Long tables are emitted as several tables of this many rows: ReportLab
+# re-splits a table on every page break, so one huge table lays out in
+# quadratic time.
+_PDF_TABLE_CHUNK_ROWS = 500
+
+
+_BASE_TABLE_STYLE = TableStyle([
+    # Header row
+    ("BACKGROUND", (0, 0), (-1, 0), _BRAND_ORANGE),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 10),
+    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+    ("TOPPADDING", (0, 0), (-1, 0), 8),
+    # All cells
+    ("FONTSIZE", (0, 1), (-1, -1), 9),
+    ("TOPPADDING", (0, 1), (-1, -1), 5),
+    ("BOTTOMPADDING", (0, 1), (-1, -1), 5),
+    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#e2e8f0")),
     # Alternate row shading
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            style_cmds.append(("BACKGROUND", (0, i), (-1, i), _ROW_ALT))
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [None, _ROW_ALT]),
+])
 
-    t.setStyle(TableStyle(style_cmds))
+
+def _new_doc(buf: io.BytesIO) -> SimpleDocTemplate:
+    """A4 document with the standard report margins."""
+    return SimpleDocTemplate(
+        buf,
+        pagesize=A4,
+        topMargin=30 * mm,
+        bottomMargin=20 * mm,
+        leftMargin=20 * mm,
+        rightMargin=20 * mm,
+    )
+
+
+def warm_up() -> None:
+    """Build a throwaway PDF so font metrics and layout code are loaded.
+
+    Called once at startup; otherwise the first report export in each worker
+    pays for loading them.
+    """
+    _new_doc(io.BytesIO()).build([
+        Paragraph("warm-up", _TITLE_STYLE),
+        Paragraph("warm-up", _BODY_STYLE),
+        _make_table(["a"], [["b"]]),
+    ])
+
+
+def _make_table(headers: list[str], rows: list[list], col_widths=None) -> Table:
+    """Create a styled ReportLab table."""
+    t = Table([headers] + rows, colWidths=col_widths, repeatRows=1)
+    t.setStyle(_BASE_TABLE_STYLE)
     return t
 
 
@@ -277,19 +371,12 @@ def generate_analytics_pdf(
     overview = analytics_service.get_overview(db, start_date, end_date)
     perf = analytics_service.get_response_performance(db, start_date, end_date)
     esc = analytics_service.get_escalation_metrics(db, start_date, end_date)
-    agents = analytics_service.get_agent_performance(db)
+    agents = analytics_service.get_agent_performance(db, start_date, end_date)
     top_q = analytics_service.get_top_queries(db, limit=15)
     trends = analytics_service.get_query_trends(db, start_date, end_date, interval="day")
 
     buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=A4,
-        topMargin=30 * mm,
-        bottomMargin=20 * mm,
-        leftMargin=20 * mm,
-        rightMargin=20 * mm,
-    )
+    doc = _new_doc(buf)
 
     elements = []
     page_width = A4[0] - 40 * mm  # usable width
@@ -433,21 +520,27 @@ def generate_escalation_pdf(
     end_date: datetime | None = None,
 ) -> bytes:
     """Generate an escalation-focused PDF report."""
-    q = db.query(Ticket).order_by(Ticket.created_at.desc())
+    # Only the rendered columns — no ORM identity map, no lazy-load hazards
+    q = db.query(
+        Ticket.id,
+        Ticket.status,
+        Ticket.priority,
+        func.left(Ticket.reason, 40).label("reason"),
+        func.to_char(Ticket.created_at, "YYYY-MM-DD").label("created"),
+        _resolution_seconds().label("resolution_seconds"),
+    ).order_by(Ticket.created_at.desc())
     q = _date_filter(q, Ticket.created_at, start_date, end_date)
-    tickets = q.all()
+    max_rows = settings.PDF_MAX_TICKET_ROWS
+    tickets = q.limit(max_rows + 1).all()
+    omitted = 0
+    if len(tickets) > max_rows:
+        omitted = fast_count(q, Ticket.id) - max_rows
+        tickets = tickets[:max_rows]
 
     esc = analytics_service.get_escalation_metrics(db, start_date, end_date)
 
     buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=A4,
-        topMargin=30 * mm,
-        bottomMargin=20 * mm,
-        leftMargin=20 * mm,
-        rightMargin=20 * mm,
-    )
+    doc = _new_doc(buf)
 
     elements = []
     page_width = A4[0] - 40 * mm
@@ -491,26 +584,131 @@ def generate_escalation_pdf(
         elements.append(Paragraph("Ticket Details", _SECTION_STYLE))
         ticket_rows = []
         for t in tickets:
-            res_time = ""
-            if t.resolved_at and t.created_at:
-                delta = (t.resolved_at - t.created_at).total_seconds() / 3600
-                res_time = f"{round(delta, 1)} hrs"
-
+            res_hours = _resolution_hours(t.resolution_seconds)
             ticket_rows.append([
                 str(t.id),
                 t.status.value,
                 t.priority.value,
-                (t.reason or "")[:40],
-                t.created_at.strftime("%Y-%m-%d") if t.created_at else "",
-                res_time or "—",
+                t.reason or "",
+                t.created or "",
+                f"{res_hours} hrs" if res_hours != "" else "—",
             ])
 
         cw = page_width / 6
-        elements.append(_make_table(
-            ["ID", "Status", "Priority", "Reason", "Created", "Resolution"],
-            ticket_rows,
-            col_widths=[cw * 0.6, cw * 0.9, cw * 0.8, cw * 1.6, cw * 1.0, cw * 1.1],
-        ))
+        for i in range(0, len(ticket_rows), _PDF_TABLE_CHUNK_ROWS):
+            elements.append(_make_table(
+                ["ID", "Status", "Priority", "Reason", "Created", "Resolution"],
+                ticket_rows[i:i + _PDF_TABLE_CHUNK_ROWS],
+                col_widths=[cw * 0.6, cw * 0.9, cw * 0.8, cw * 1.6, cw * 1.0, cw * 1.1],
+            ))
+
+        if omitted:
+            elements.append(Spacer(1, 8))
+            elements.append(Paragraph(
+                f"…and {omitted} more tickets — see the CSV export for the full list.",
+                _BODY_STYLE,
+            ))
 
     doc.build(elements)
     return buf.getvalue()
+
+
+# ═══════════════════════════════════════════════════════════════
+#  BACKGROUND REPORT JOBS
+# ═══════════════════════════════════════════════════════════════
+
+# Job state lives on disk under REPORT_DIR so any worker can answer a poll:
+# <id>.pending while building, <id>.pdf when done, <id>.failed on error.
+# Clients only ever see generic failure messages; the cause goes to the log.
+_JOB_FAILED = "Report generation failed"
+_JOB_TIMED_OUT = "Report generation did not finish"
+_REPORT_BUILDERS = {
+    "analytics": generate_analytics_pdf,
+    "escalations": generate_escalation_pdf,
+}
+
+_report_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.REPORT_WORKERS),
+    thread_name_prefix="report",
+)
+
+
+def _report_dir() -> Path:
+    """Ensure the report directory exists and return its Path."""
+    path = Path(settings.REPORT_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _prune_reports(directory: Path) -> None:
+    """Remove job files older than REPORT_RETENTION_HOURS."""
+    cutoff = time.time() - settings.REPORT_RETENTION_HOURS * 3600
+    for path in directory.iterdir():
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def submit_report_job(
+    kind: str,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> str:
+    """Queue a PDF report build and return its job id.
+
+    Raises ValueError for an unknown report kind.
+    """
+    if kind not in _REPORT_BUILDERS:
+        raise ValueError(f"Unknown report kind: {kind}")
+
+    directory = _report_dir()
+    _prune_reports(directory)
+    job_id = uuid4().hex
+    (directory / f"{job_id}.pending").touch()
+    _report_pool.submit(_run_report_job, job_id, kind, start_date, end_date)
+    logger.info("Queued %s report job %s", kind, job_id)
+    return job_id
+
+
+def _run_report_job(job_id: str, kind: str, start_date: datetime | None, end_date: datetime | None) -> None:
+    """Build the report on its own session and publish it atomically."""
+    directory = _report_dir()
+    db = SessionLocal()
+    try:
+        pdf = _REPORT_BUILDERS[kind](db, start_date, end_date)
+        tmp = directory / f"{job_id}.pdf.tmp"
+        tmp.write_bytes(pdf)
+        os.replace(tmp, directory / f"{job_id}.pdf")
+        logger.info("Report job %s finished (%d bytes)", job_id, len(pdf))
+    except Exception:
+        logger.exception("Report job %s failed", job_id)
+        (directory / f"{job_id}.failed").write_text(_JOB_FAILED)
+    finally:
+        db.close()
+        (directory / f"{job_id}.pending").unlink(missing_ok=True)
+
+
+def get_report_job(job_id: str) -> tuple[str, Path | None, str | None] | None:
+    """Return ``(status, pdf_path, error)`` for a job, or None if it is unknown.
+
+    *pdf_path* is set once the job is done, *error* once it has failed. A job
+    pending for longer than REPORT_BUILD_TIMEOUT_SECONDS lost its worker (a
+    restart or crash mid-build) and is reported as failed.
+    """
+    if len(job_id) != 32 or not all(c in "0123456789abcdef" for c in job_id):
+        return None
+    directory = _report_dir()
+    pdf = directory / f"{job_id}.pdf"
+    if pdf.exists():
+        return "done", pdf, None
+    if (directory / f"{job_id}.failed").exists():
+        return "failed", None, _JOB_FAILED
+    try:
+        started = (directory / f"{job_id}.pending").stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if time.time() - started > settings.REPORT_BUILD_TIMEOUT_SECONDS:
+        return "failed", None, _JOB_TIMED_OUT
+    return "pending", None, None
@@ -0,0 +1,109 @@
+"""Rollup service — pre-aggregated query_logs buckets for dashboard charts.
+
+``mv_query_log_daily`` is a PostgreSQL materialized view holding one row per
+hour of query_logs activity (with its day alongside). Trend charts sum these
+buckets instead of scanning query_logs on every request.
+``mv_query_log_hourly`` folds all activity into 24 hour-of-day rows for the
+peak-hours chart, and ``mv_top_queries`` keeps the most frequent questions.
+The views are refreshed periodically in the background, so
+charts can lag live data by up to ANALYTICS_ROLLUP_REFRESH_SECONDS. Until the
+migrations creating them have run, analytics queries query_logs directly.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, MetaData, SmallInteger, Table, Text, text
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Kept out of Base.metadata so create_all / autogenerate leave the views alone
+_rollup_metadata = MetaData()
+
+query_log_rollup = Table(
+    "mv_query_log_daily",
+    _rollup_metadata,
+    Column("day", DateTime),
+    Column("hour", DateTime),
+    Column("n", BigInteger),        # queries
+    Column("esc", BigInteger),      # escalated queries
+    Column("conf_n", BigInteger),   # queries with a confidence score
+    Column("conf_sum", Float),
+    Column("rt_n", BigInteger),     # queries with a response time
+    Column("rt_sum", BigInteger),
+    Column("hi", BigInteger),       # confidence >= 0.7
+    Column("med", BigInteger),      # 0.4 <= confidence < 0.7
+    Column("lo", BigInteger),       # confidence < 0.4
+    Column("ev", BigInteger),       # has_sufficient_evidence
+    Column("src_sum", BigInteger),
+)
+
+query_log_hour_of_day = Table(
+    "mv_query_log_hourly",
+    _rollup_metadata,
+    Column("hour_of_day", SmallInteger),
+    Column("n", BigInteger),
+)
+
+top_queries_rollup = Table(
+    "mv_top_queries",
+    _rollup_metadata,
+    Column("query_text_hash", BigInteger),
+    Column("query_text", Text),
+    Column("cnt", BigInteger),
+    Column("avg_conf", Float),
+)
+
+# The views and the unique indexes REFRESH ... CONCURRENTLY needs are created
+# by Alembic (revisions c3a9f0d27e51, b58d1f3a7c62, c07e4a92d5b8); this module
+# only reads and refreshes them
+_VIEWS = (query_log_rollup.name, query_log_hour_of_day.name, top_queries_rollup.name)
+_present: set[str] = set()
+
+# Arbitrary constant — keeps several app workers from refreshing at once
+_REFRESH_LOCK_ID = 720_431
+
+
+def missing_rollups(conn) -> list[str]:
+    """Return the rollup views that don't exist yet (migrations not applied).
+
+    *conn* is a Connection or Session. Views are never dropped at runtime, so
+    once all have been seen the catalog isn't queried again.
+    """
+    if not _present.issuperset(_VIEWS):
+        names = conn.execute(text("SELECT matviewname FROM pg_matviews")).scalars()
+        _present.update(name for name in names if name in _VIEWS)
+    return [name for name in _VIEWS if name not in _present]
+
+
+def rollup_available(conn, view: Table) -> bool:
+    """True once *view* exists; callers fall back to scanning query_logs otherwise."""
+    return view.name not in missing_rollups(conn)
+
+
+def refresh_rollups(engine: Engine) -> bool:
+    """Refresh the rollup views without blocking readers.
+
+    Returns False when another worker already holds the refresh lock.
+    """
+    with engine.begin() as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_xact_lock(:k)"), {"k": _REFRESH_LOCK_ID}).scalar():
+            return False
+        for name in _VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}"))
+    return True
+
+
+async def refresh_loop(engine: Engine) -> None:
+    """Refresh the rollups every ANALYTICS_ROLLUP_REFRESH_SECONDS until cancelled."""
+    interval = settings.ANALYTICS_ROLLUP_REFRESH_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if await asyncio.to_thread(refresh_rollups, engine):
+                logger.debug("Refreshed analytics rollups")
+        except Exception as exc:
+            logger.warning("Rollup refresh failed: %s", exc)
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, insert
 from sqlalchemy.orm import Session
 
 from app.models.conversation import Conversation, ConversationStatus, Message, SenderRole
@@ -22,29 +22,37 @@ def _priority_from_confidence(confidence_score: float) -> TicketPriority:
     return TicketPriority.low
 
 
+def visible_tickets(db: Session, user: User):
+    """Base ticket query scoped to what *user* may see.
+
+    Admins see every ticket, agents their assigned tickets and customers
+    their own. Keeping the scoping here means list endpoints can't forget it.
+    """
+    query = db.query(Ticket)
+    if user.role == UserRole.agent:
+        query = query.filter(Ticket.assigned_agent_id == user.id)
+    elif user.role == UserRole.customer:
+        query = query.filter(Ticket.customer_id == user.id)
+    return query
+
+
 def find_least_loaded_agent(db: Session) -> User | None:
-    """Find the agent with the fewest open/in-progress tickets."""
-    agents = db.query(User).filter(User.role == UserRole.agent, User.is_active == True).all()
-    if not agents:
-        return None
-
-    best_agent = None
-    min_load = float("inf")
-
-    for agent in agents:
-        load = (
-            db.query(func.count(Ticket.id))
-            .filter(
-                Ticket.assigned_agent_id == agent.id,
+    """Find the agent with the fewest open/in-progress tickets (one GROUP BY)."""
+    load = func.count(Ticket.id)
+    return (
+        db.query(User)
+        .outerjoin(
+            Ticket,
+            and_(
+                Ticket.assigned_agent_id == User.id,
                 Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress]),
-            )
-            .scalar()
-        ) or 0
-        if load < min_load:
-            min_load = load
-            best_agent = agent
-
-    return best_agent
+            ),
+        )
+        .filter(User.role == UserRole.agent, User.is_active == True)
+        .group_by(User.id)
+        .order_by(load, User.id)
+        .first()
+    )
 
 
 def create_ticket(
@@ -66,31 +74,37 @@ def create_ticket(
         except ValueError:
             ticket_priority = TicketPriority.medium
 
-    # Check for existing open ticket on this conversation
-    existing = (
-        db.query(Ticket)
+    # Check for existing open ticket on this conversation — id only (index-only
+    # scan); the full row is loaded just in the rare already-exists case
+    existing_id = (
+        db.query(Ticket.id)
         .filter(
             Ticket.conversation_id == conversation_id,
             Ticket.status.in_([TicketStatus.open, TicketStatus.in_progress]),
         )
-        .first()
+        .limit(1)
+        .scalar()
     )
-    if existing:
-        logger.info("Ticket already exists for conversation %d: ticket %d", conversation_id, existing.id)
-        return existing
+    if existing_id is not None:
+        logger.info("Ticket already exists for conversation %d: ticket %d", conversation_id, existing_id)
+        return db.get(Ticket, existing_id)
 
     # Auto-assign
     agent = find_least_loaded_agent(db)
 
-    ticket = Ticket(
-        conversation_id=conversation_id,
-        customer_id=customer_id,
-        assigned_agent_id=agent.id if agent else None,
-        status=TicketStatus.open,
-        priority=ticket_priority,
-        reason=reason,
-    )
-    db.add(ticket)
+    # INSERT ... RETURNING hands back the persistent row in the same round-trip
+    ticket = db.execute(
+        insert(Ticket)
+        .values(
+            conversation_id=conversation_id,
+            customer_id=customer_id,
+            assigned_agent_id=agent.id if agent else None,
+            status=TicketStatus.open,
+            priority=ticket_priority,
+            reason=reason,
+        )
+        .returning(Ticket)
+    ).scalar_one()
 
     # Update conversation status to escalated
     conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
@@ -136,7 +150,7 @@ def update_ticket(
         # Validate agent exists
         agent = db.query(User).filter(User.id == assigned_agent_id, User.role == UserRole.agent).first()
         if agent:
-            ticket.assigned_agent_id = agent.id
+            ticket.assigned_agent = agent
 
     db.flush()
     return ticket
@@ -149,12 +163,15 @@ def add_agent_response(
     content: str,
 ) -> Message:
     """Add an agent message to the ticket's conversation."""
-    msg = Message(
-        conversation_id=ticket.conversation_id,
-        sender_role=SenderRole.agent,
-        content=content,
-    )
-    db.add(msg)
+    msg = db.execute(
+        insert(Message)
+        .values(
+            conversation_id=ticket.conversation_id,
+            sender_role=SenderRole.agent,
+            content=content,
+        )
+        .returning(Message)
+    ).scalar_one()
 
     # Move ticket to in_progress if still open
     if ticket.status == TicketStatus.open:
@@ -166,20 +183,14 @@ def add_agent_response(
 
 
 def get_agent_workload(db: Session, agent_id: int) -> dict:
-    """Return ticket counts for an agent."""
-    open_count = (
-        db.query(func.count(Ticket.id))
-        .filter(Ticket.assigned_agent_id == agent_id, Ticket.status == TicketStatus.open)
-        .scalar()
-    ) or 0
-    in_progress = (
-        db.query(func.count(Ticket.id))
-        .filter(Ticket.assigned_agent_id == agent_id, Ticket.status == TicketStatus.in_progress)
-        .scalar()
-    ) or 0
-    resolved = (
-        db.query(func.count(Ticket.id))
-        .filter(Ticket.assigned_agent_id == agent_id, Ticket.status == TicketStatus.resolved)
-        .scalar()
-    ) or 0
+    """Return ticket counts for an agent (one GROUP BY over status)."""
+    counts = dict(
+        db.query(Ticket.status, func.count(Ticket.id))
+        .filter(Ticket.assigned_agent_id == agent_id)
+        .group_by(Ticket.status)
+        .all()
+    )
+    open_count = counts.get(TicketStatus.open, 0)
+    in_progress = counts.get(TicketStatus.in_progress, 0)
+    resolved = counts.get(TicketStatus.resolved, 0)
     return {"open": open_count, "in_progress": in_progress, "resolved": resolved, "total": open_count + in_progress + resolved}
@@ -2,21 +2,78 @@
 
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.core.security import hash_password, verify_password
 from app.models.user import User, UserRole
 
 logger = logging.getLogger(__name__)
 
+# ("email", email) -> detached User snapshot, for the login lookup only. Dropped
+# after any commit that wrote users; other workers may serve a snapshot up to
+# USER_CACHE_TTL_SECONDS old.
+_user_cache = TTLCache()
+
+
+def invalidate_user_cache() -> None:
+    """Drop all cached user lookups."""
+    _user_cache.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _track_user_writes(session, _flush_context):
+    if any(isinstance(obj, User) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["users_stale"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users_after_commit(session):
+    if session.info.pop("users_stale", False):
+        invalidate_user_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_users_after_rollback(session):
+    session.info.pop("users_stale", None)
+
+
+def _snapshot(user: User) -> User:
+    """Detached copy of *user*'s column values, safe to share between sessions."""
+    copy = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _lookup(db: Session, key: tuple, criterion) -> User | None:
+    """Load the user matching *criterion*, through the shared snapshot cache."""
+    ttl = settings.USER_CACHE_TTL_SECONDS
+    if ttl > 0:
+        hit, cached = _user_cache.get(key)
+        if hit:
+            # Attach a copy to this session without re-querying
+            return db.merge(cached, load=False)
+
+    user = db.query(User).filter(criterion).first()
+    if user is not None and ttl > 0:
+        _user_cache.set(key, _snapshot(user), ttl)
+    return user
+
 
 def get_user_by_email(db: Session, email: str) -> User | None:
-    """Look up a user by email address."""
-    return db.query(User).filter(User.email == email).first()
+    """Look up a user by email address (cached for USER_CACHE_TTL_SECONDS)."""
+    return _lookup(db, ("email", email), User.email == email)
 
 
 def get_user_by_id(db: Session, user_id: int) -> User | None:
-    """Look up a user by primary key."""
+    """Look up a user by primary key.
+
+    Always read from the database: this backs per-request auth, where a
+    deactivated or demoted user must lose access on every worker at once.
+    """
     return db.query(User).filter(User.id == user_id).first()
 
 
@@ -30,10 +87,12 @@ def create_user(
 ) -> User:
     """Create a new user with hashed password.
 
-    Raises ValueError if the email is already taken.
+    Raises ValueError if the email is already taken (enforced by the unique
+    index on users.email, so concurrent registrations can't both succeed).
     """
-    existing = get_user_by_email(db, email)
-    if existing:
+    # Cheap index lookup first so a taken email never pays for a bcrypt hash;
+    # the unique index still settles races between concurrent registrations
+    if db.query(User.id).filter(User.email == email).limit(1).scalar() is not None:
         raise ValueError("A user with this email already exists")
 
     user = User(
@@ -43,8 +102,11 @@ def create_user(
         role=role,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise ValueError("A user with this email already exists")
     logger.info("Created user id=%d email=%s role=%s", user.id, user.email, user.role.value)
     return user
 
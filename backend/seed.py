@@ -6,9 +6,11 @@ import os
 # Ensure the backend package is importable when running from workspace root
 sys.path.insert(0, os.path.dirname(__file__))
 
+from sqlalchemy.dialects.postgresql import insert  # noqa: E402
+
+from app.core.security import hash_password  # noqa: E402
 from app.database import SessionLocal  # noqa: E402
-from app.models.user import UserRole  # noqa: E402
-from app.services.user_service import create_user, get_user_by_email  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
 
 SEED_USERS = [
     {"name": "Admin User", "email": "admin@example.com", "password": "admin123", "role": UserRole.admin},
@@ -18,15 +20,41 @@ SEED_USERS = [
 
 
 def seed():
-    """Insert seed users if they don't already exist."""
+    """Insert seed users if they don't already exist (one lookup, one INSERT)."""
     db = SessionLocal()
     try:
+        emails = [u["email"] for u in SEED_USERS]
+        existing = {email for (email,) in db.query(User.email).filter(User.email.in_(emails))}
+        missing = [u for u in SEED_USERS if u["email"] not in existing]
+
+        created = set()
+        if missing:
+            # ON CONFLICT: another worker may be seeding at the same moment
+            created = set(
+                db.scalars(
+                    insert(User)
+                    .values(
+                        [
+                            {
+                                "name": u["name"],
+                                "email": u["email"],
+                                "password_hash": hash_password(u["password"]),
+                                "role": u["role"],
+                            }
+                            for u in missing
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=[User.email])
+                    .returning(User.email)
+                )
+            )
+            db.commit()
+
         for u in SEED_USERS:
-            if get_user_by_email(db, u["email"]):
+            if u["email"] in created:
+                print(f"  + {u['role'].value:>8}  {u['email']} created")
+            else:
                 print(f"  ✓ {u['role'].value:>8}  {u['email']} (already exists)")
-                continue
-            create_user(db, name=u["name"], email=u["email"], password=u["password"], role=u["role"])
-            print(f"  + {u['role'].value:>8}  {u['email']} created")
     finally:
         db.close()
 
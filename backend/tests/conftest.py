@@ -1,13 +1,124 @@
 """Pytest configuration and shared fixtures."""
 
+import itertools
+import os
+import uuid
+from pathlib import Path
+
 import pytest
+from alembic import command
+from alembic.config import Config
 from fastapi.testclient import TestClient
 
-from app.main import app
+# Cheap bcrypt and cached JWT verification for the suite — neither affects what
+# the tests check (set before the app, and so its settings, is imported)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("TOKEN_CACHE_SECONDS", "30")
+
+from app.main import app  # noqa: E402
+
+# Accounts created by seed.py at startup — /register only ever makes customers
+SEEDED_ADMIN = ("admin@example.com", "admin123")
+SEEDED_AGENT = ("agent@example.com", "agent123")
+
+# Test emails are <prefix>_<run>_<n>: a counter within the run, plus one random
+# run id so a test database reused across runs never sees the same address twice
+_RUN_ID = uuid.uuid4().hex[:8]
+_email_seq = itertools.count()
+
+
+def _new_email(prefix: str) -> str:
+    return f"{prefix}_{_RUN_ID}_{next(_email_seq)}@example.com"
+
+
+def _migrate() -> None:
+    """Upgrade the test database to the latest revision, as the deploy command does."""
+    # No ini file: alembic.ini's logging config would replace the app's loggers
+    config = Config()
+    config.set_main_option("script_location", str(Path(__file__).resolve().parents[1] / "alembic"))
+    command.upgrade(config, "head")
 
 
-@pytest.fixture(scope="module")
+def _login(client, email: str, password: str) -> dict:
+    """Login and return the auth header dict."""
+    resp = client.post("/api/auth/login", json={"email": email, "password": password})
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _seeded_login(client, email: str, password: str) -> dict:
+    """Login as a seeded account, skipping the requesting tests if it isn't there."""
+    resp = client.post("/api/auth/login", json={"email": email, "password": password})
+    if resp.status_code != 200:
+        pytest.skip(f"seeded account {email} unavailable (login returned {resp.status_code})")
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def _register_customer(client) -> dict:
+    """Register a fresh customer, login, return the auth header dict."""
+    email = _new_email("customer")
+    client.post(
+        "/api/auth/register",
+        json={"name": "Test Customer", "email": email, "password": "testpass123"},
+    )
+    return _login(client, email, "testpass123")
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Test client for the FastAPI application."""
+    """Test client for the FastAPI application, started once for the whole run.
+
+    App startup (seeding, report warm-up) is the same for every module, so
+    there is nothing to gain from repeating it. The schema comes from the
+    migrations, so the rollup views and migrated columns exist as deployed.
+    """
+    _migrate()
     with TestClient(app) as c:
         yield c
+
+
+@pytest.fixture
+def new_email():
+    """Factory for unique email addresses: ``new_email("login")``."""
+    return _new_email
+
+
+# Auth headers are shared across the run: each login costs a bcrypt check and
+# each registration a bcrypt hash, which dominated the suite. A failed seeded
+# login is cached by pytest too: it is tried once and skips every test using it
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    """Auth header for the seeded admin."""
+    return _seeded_login(client, *SEEDED_ADMIN)
+
+
+@pytest.fixture(scope="session")
+def agent_headers(client):
+    """Auth header for the seeded agent."""
+    return _seeded_login(client, *SEEDED_AGENT)
+
+
+@pytest.fixture(scope="session")
+def customer_headers(client):
+    """Auth header for a customer shared by all tests."""
+    return _register_customer(client)
+
+
+@pytest.fixture
+def role_headers(request):
+    """Look up auth headers by role name; ``None`` gives no credentials.
+
+    Lets access-control tests parametrize over roles while still sharing the
+    session-scoped logins above.
+    """
+
+    def lookup(role: str | None) -> dict:
+        return {} if role is None else request.getfixturevalue(f"{role}_headers")
+
+    return lookup
+
+
+@pytest.fixture
+def fresh_customer_headers(client):
+    """Auth header for a brand-new customer, for tests that need an empty account."""
+    return _register_customer(client)
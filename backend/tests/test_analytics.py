@@ -1,44 +1,18 @@
 """Tests for analytics endpoints — admin-only dashboard data."""
 
-import uuid
-
 import pytest
 
 
-# ── Helpers ───────────────────────────────────────────────────
-
-def _register_and_login(client, role="customer"):
-    """Register a fresh user, login, return the auth header dict."""
-    email = f"analytics_{uuid.uuid4().hex[:8]}@example.com"
-    client.post(
-        "/api/auth/register",
-        json={
-            "name": f"Analytics {role.title()}",
-            "email": email,
-            "password": "testpass123",
-            "role": role,
-        },
-    )
-    login_resp = client.post(
-        "/api/auth/login",
-        json={"email": email, "password": "testpass123"},
-    )
-    token = login_resp.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
 # ── Access control ───────────────────────────────────────────
 
-def test_overview_requires_admin(client):
+def test_overview_requires_admin(client, customer_headers):
     """Non-admin users should be rejected from analytics."""
-    customer_headers = _register_and_login(client, "customer")
     resp = client.get("/api/analytics/overview", headers=customer_headers)
     assert resp.status_code == 403
 
 
-def test_overview_rejects_agent(client):
+def test_overview_rejects_agent(client, agent_headers):
     """Agents should also be rejected from analytics."""
-    agent_headers = _register_and_login(client, "agent")
     resp = client.get("/api/analytics/overview", headers=agent_headers)
     assert resp.status_code == 403
 
@@ -51,9 +25,8 @@ def test_overview_requires_auth(client):
 
 # ── Overview endpoint ────────────────────────────────────────
 
-def test_overview_returns_structure(client):
+def test_overview_returns_structure(client, admin_headers):
     """GET /api/analytics/overview returns all expected fields."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/overview", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -67,9 +40,8 @@ def test_overview_returns_structure(client):
     assert "resolved_tickets" in data
 
 
-def test_overview_with_date_filter(client):
+def test_overview_with_date_filter(client, admin_headers):
     """Overview accepts optional date range params."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get(
         "/api/analytics/overview",
         params={"start_date": "2026-01-01", "end_date": "2026-12-31"},
@@ -80,9 +52,8 @@ def test_overview_with_date_filter(client):
 
 # ── Query trends ─────────────────────────────────────────────
 
-def test_query_trends_returns_structure(client):
+def test_query_trends_returns_structure(client, admin_headers):
     """GET /api/analytics/query-trends returns trends array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/query-trends", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -91,24 +62,22 @@ def test_query_trends_returns_structure(client):
     assert isinstance(data["trends"], list)
 
 
-def test_query_trends_accepts_interval(client):
+@pytest.mark.parametrize("interval", ["day", "week", "month"])
+def test_query_trends_accepts_interval(client, admin_headers, interval):
     """Query trends accepts day/week/month interval."""
-    admin_headers = _register_and_login(client, "admin")
-    for interval in ("day", "week", "month"):
-        resp = client.get(
-            "/api/analytics/query-trends",
-            params={"interval": interval},
-            headers=admin_headers,
-        )
-        assert resp.status_code == 200
-        assert resp.json()["interval"] == interval
+    resp = client.get(
+        "/api/analytics/query-trends",
+        params={"interval": interval},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["interval"] == interval
 
 
 # ── Response performance ─────────────────────────────────────
 
-def test_response_performance_returns_structure(client):
+def test_response_performance_returns_structure(client, admin_headers):
     """GET /api/analytics/response-performance returns confidence distribution."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/response-performance", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -122,9 +91,8 @@ def test_response_performance_returns_structure(client):
 
 # ── Confidence trend ─────────────────────────────────────────
 
-def test_confidence_trend_returns_structure(client):
+def test_confidence_trend_returns_structure(client, admin_headers):
     """GET /api/analytics/confidence-trend returns trends array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/confidence-trend", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -134,9 +102,8 @@ def test_confidence_trend_returns_structure(client):
 
 # ── Escalation metrics ───────────────────────────────────────
 
-def test_escalation_metrics_returns_structure(client):
+def test_escalation_metrics_returns_structure(client, admin_headers):
     """GET /api/analytics/escalations returns breakdown."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/escalations", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -149,9 +116,8 @@ def test_escalation_metrics_returns_structure(client):
 
 # ── Escalation trend ─────────────────────────────────────────
 
-def test_escalation_trend_returns_structure(client):
+def test_escalation_trend_returns_structure(client, admin_headers):
     """GET /api/analytics/escalation-trend returns trends array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/escalation-trend", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -161,9 +127,8 @@ def test_escalation_trend_returns_structure(client):
 
 # ── Agent performance ────────────────────────────────────────
 
-def test_agent_performance_returns_structure(client):
+def test_agent_performance_returns_structure(client, admin_headers):
     """GET /api/analytics/agents returns agents array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/agents", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -173,9 +138,8 @@ def test_agent_performance_returns_structure(client):
 
 # ── Top queries ──────────────────────────────────────────────
 
-def test_top_queries_returns_structure(client):
+def test_top_queries_returns_structure(client, admin_headers):
     """GET /api/analytics/top-queries returns queries array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/top-queries", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
@@ -183,9 +147,8 @@ def test_top_queries_returns_structure(client):
     assert isinstance(data["queries"], list)
 
 
-def test_top_queries_accepts_limit(client):
+def test_top_queries_accepts_limit(client, admin_headers):
     """Top queries accepts a limit parameter."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get(
         "/api/analytics/top-queries",
         params={"limit": 5},
@@ -196,9 +159,8 @@ def test_top_queries_accepts_limit(client):
 
 # ── Peak hours ───────────────────────────────────────────────
 
-def test_peak_hours_returns_structure(client):
+def test_peak_hours_returns_structure(client, admin_headers):
     """GET /api/analytics/peak-hours returns hours array."""
-    admin_headers = _register_and_login(client, "admin")
     resp = client.get("/api/analytics/peak-hours", headers=admin_headers)
     assert resp.status_code == 200
     data = resp.json()
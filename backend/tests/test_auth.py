@@ -1,11 +1,9 @@
 """Tests for authentication endpoints."""
 
-import uuid
 
-
-def test_register_user(client):
+def test_register_user(client, new_email):
     """Test user registration creates a customer account."""
-    email = f"testuser_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("testuser")
     response = client.post(
         "/api/auth/register",
         json={"name": "Test User", "email": email, "password": "securepass123"},
@@ -18,9 +16,9 @@ def test_register_user(client):
     assert "id" in data
 
 
-def test_register_duplicate_email(client):
+def test_register_duplicate_email(client, new_email):
     """Test registering with an existing email returns 409."""
-    email = f"dup_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("dup")
     client.post(
         "/api/auth/register",
         json={"name": "First", "email": email, "password": "pass12345"},
@@ -42,9 +40,9 @@ def test_register_short_password(client):
     assert response.status_code == 422
 
 
-def test_login_success(client):
+def test_login_success(client, new_email):
     """Test login returns access token and user info."""
-    email = f"login_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("login")
     client.post(
         "/api/auth/register",
         json={"name": "Login User", "email": email, "password": "loginpass123"},
@@ -60,9 +58,9 @@ def test_login_success(client):
     assert data["user"]["email"] == email
 
 
-def test_login_wrong_password(client):
+def test_login_wrong_password(client, new_email):
     """Test login with wrong password returns 401."""
-    email = f"wrongpw_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("wrongpw")
     client.post(
         "/api/auth/register",
         json={"name": "Wrong PW", "email": email, "password": "correctpass1"},
@@ -83,9 +81,9 @@ def test_login_nonexistent_email(client):
     assert response.status_code == 401
 
 
-def test_me_endpoint(client):
+def test_me_endpoint(client, new_email):
     """Test GET /me returns current user info."""
-    email = f"me_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("me")
     client.post(
         "/api/auth/register",
         json={"name": "Me User", "email": email, "password": "mepass12345"},
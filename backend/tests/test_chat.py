@@ -1,38 +1,11 @@
 """Tests for chat endpoints — conversations and messages."""
 
-import uuid
-
-import pytest
-
-
-# ── Helpers ───────────────────────────────────────────────────
-
-def _register_and_login(client, role="customer"):
-    """Register a fresh user, login, return the auth header dict."""
-    email = f"chat_{uuid.uuid4().hex[:8]}@example.com"
-    client.post(
-        "/api/auth/register",
-        json={
-            "name": "Chat Tester",
-            "email": email,
-            "password": "testpass123",
-            "role": role,
-        },
-    )
-    login_resp = client.post(
-        "/api/auth/login",
-        json={"email": email, "password": "testpass123"},
-    )
-    token = login_resp.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
 
 # ── Conversation CRUD ─────────────────────────────────────────
 
-def test_create_conversation(client):
+def test_create_conversation(client, customer_headers):
     """POST /api/chat/ creates a new conversation."""
-    headers = _register_and_login(client)
-    resp = client.post("/api/chat/", json={"title": None}, headers=headers)
+    resp = client.post("/api/chat/", json={"title": None}, headers=customer_headers)
     assert resp.status_code == 201
     data = resp.json()
     assert data["status"] == "active"
@@ -40,21 +13,19 @@ def test_create_conversation(client):
     assert data["message_count"] == 0
 
 
-def test_list_conversations_empty(client):
+def test_list_conversations_empty(client, fresh_customer_headers):
     """GET /api/chat/ returns empty list for fresh user."""
-    headers = _register_and_login(client)
-    resp = client.get("/api/chat/", headers=headers)
+    resp = client.get("/api/chat/", headers=fresh_customer_headers)
     assert resp.status_code == 200
     data = resp.json()
     assert data["total"] == 0
     assert data["items"] == []
 
 
-def test_list_conversations_after_create(client):
+def test_list_conversations_after_create(client, fresh_customer_headers):
     """GET /api/chat/ returns the conversation just created."""
-    headers = _register_and_login(client)
-    client.post("/api/chat/", json={"title": "My chat"}, headers=headers)
-    resp = client.get("/api/chat/", headers=headers)
+    client.post("/api/chat/", json={"title": "My chat"}, headers=fresh_customer_headers)
+    resp = client.get("/api/chat/", headers=fresh_customer_headers)
     assert resp.status_code == 200
     data = resp.json()
     assert data["total"] == 1
@@ -63,15 +34,14 @@ def test_list_conversations_after_create(client):
 
 # ── Messages ──────────────────────────────────────────────────
 
-def test_send_message_returns_ai_response(client):
+def test_send_message_returns_ai_response(client, customer_headers):
     """POST /api/chat/{id}/message returns an AI response with sources/confidence."""
-    headers = _register_and_login(client)
-    conv = client.post("/api/chat/", json={"title": None}, headers=headers).json()
+    conv = client.post("/api/chat/", json={"title": None}, headers=customer_headers).json()
 
     resp = client.post(
         f"/api/chat/{conv['id']}/message",
         json={"content": "What is your return policy?"},
-        headers=headers,
+        headers=customer_headers,
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -85,36 +55,34 @@ def test_send_message_returns_ai_response(client):
     assert "escalation_action" in data["confidence"]
 
 
-def test_send_message_sets_conversation_title(client):
+def test_send_message_sets_conversation_title(client, fresh_customer_headers):
     """First message auto-sets the conversation title."""
-    headers = _register_and_login(client)
-    conv = client.post("/api/chat/", json={"title": None}, headers=headers).json()
+    conv = client.post("/api/chat/", json={"title": None}, headers=fresh_customer_headers).json()
     assert conv["title"] is None
 
     client.post(
         f"/api/chat/{conv['id']}/message",
         json={"content": "How do I reset my password?"},
-        headers=headers,
+        headers=fresh_customer_headers,
     )
 
     # Fetch conversations — title should now be set
-    convs = client.get("/api/chat/", headers=headers).json()
+    convs = client.get("/api/chat/", headers=fresh_customer_headers).json()
     assert convs["items"][0]["title"] is not None
     assert "reset" in convs["items"][0]["title"].lower()
 
 
-def test_get_messages_history(client):
+def test_get_messages_history(client, customer_headers):
     """GET /api/chat/{id}/messages returns user + AI messages in order."""
-    headers = _register_and_login(client)
-    conv = client.post("/api/chat/", json={"title": None}, headers=headers).json()
+    conv = client.post("/api/chat/", json={"title": None}, headers=customer_headers).json()
 
     client.post(
         f"/api/chat/{conv['id']}/message",
         json={"content": "Hello"},
-        headers=headers,
+        headers=customer_headers,
     )
 
-    resp = client.get(f"/api/chat/{conv['id']}/messages", headers=headers)
+    resp = client.get(f"/api/chat/{conv['id']}/messages", headers=customer_headers)
     assert resp.status_code == 200
     messages = resp.json()
     assert len(messages) >= 2  # at least user + AI
@@ -124,21 +92,19 @@ def test_get_messages_history(client):
 
 # ── Access control ────────────────────────────────────────────
 
-def test_send_message_to_nonexistent_conversation(client):
+def test_send_message_to_nonexistent_conversation(client, customer_headers):
     """POST to a non-existent conversation returns 404."""
-    headers = _register_and_login(client)
     resp = client.post(
         "/api/chat/99999/message",
         json={"content": "hello"},
-        headers=headers,
+        headers=customer_headers,
     )
     assert resp.status_code == 404
 
 
-def test_get_messages_nonexistent_conversation(client):
+def test_get_messages_nonexistent_conversation(client, customer_headers):
     """GET messages for non-existent conversation returns 404."""
-    headers = _register_and_login(client)
-    resp = client.get("/api/chat/99999/messages", headers=headers)
+    resp = client.get("/api/chat/99999/messages", headers=customer_headers)
     assert resp.status_code == 404
 
 
@@ -151,24 +117,21 @@ def test_chat_requires_auth(client):
     assert resp.status_code in (401, 403)
 
 
-def test_cannot_access_other_users_conversation(client):
+def test_cannot_access_other_users_conversation(client, customer_headers, fresh_customer_headers):
     """A customer cannot see another customer's conversation."""
-    headers_a = _register_and_login(client)
-    headers_b = _register_and_login(client)
-
-    conv = client.post("/api/chat/", json={"title": None}, headers=headers_a).json()
+    conv = client.post("/api/chat/", json={"title": None}, headers=customer_headers).json()
 
     resp = client.post(
         f"/api/chat/{conv['id']}/message",
         json={"content": "hello"},
-        headers=headers_b,
+        headers=fresh_customer_headers,
     )
     assert resp.status_code == 403
 
 
-def test_register_with_role(client):
+def test_register_with_role(client, new_email):
     """Test registering with a specific role works."""
-    email = f"agent_{uuid.uuid4().hex[:8]}@example.com"
+    email = new_email("agent")
     resp = client.post(
         "/api/auth/register",
         json={